@@ -162,12 +162,23 @@ These error checks ensure that the Picoschema is well-formed and can be
 correctly translated to JSON Schema.
 """
 
+import copy
+import functools
+import math
 import re
+from collections.abc import Callable, Iterator
 from typing import Any, cast
 
-from dotpromptz.resolvers import resolve_json_schema
+import anyio
+
+from dotpromptz.resolvers import _is_async_resolver, resolve_json_schema
 from dotpromptz.typing import JsonSchema, SchemaResolver
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
 JSON_SCHEMA_SCALAR_TYPES = [
     'any',
     'boolean',
@@ -179,6 +190,14 @@ JSON_SCHEMA_SCALAR_TYPES = [
 
 WILDCARD_PROPERTY_NAME = '(*)'
 
+# Regular expression to split a Picoschema type string into the type/name and
+# its description at the first comma.
+#
+# Examples of matching patterns:
+# - string, the name of the user
+# - CustomSchema, a custom field
+DESCRIPTION_REGEX = re.compile(r'(.*?), *(.*)$')
+
 
 def _is_json_schema(schema: dict[str, Any]) -> bool:
     """Checks if a schema is already in JSON Schema format.
@@ -210,6 +229,78 @@ async def picoschema_to_json_schema(schema: Any, schema_resolver: SchemaResolver
     return await PicoschemaParser(schema_resolver).parse(schema)
 
 
+async def compile_pico(schema: Any, schema_resolver: SchemaResolver | None = None) -> Callable[[], JsonSchema | None]:
+    """Compiles a Picoschema definition into a specialized builder function.
+
+    The definition is parsed once and turned into generated Python source that
+    constructs the resulting JSON Schema directly from literals, so calling the
+    builder skips the suffix and description parsing entirely. Each call
+    returns a fresh object that the caller is free to mutate.
+
+    The input is handled exactly as by `picoschema_to_json_schema`: JSON
+    Schema passes through unchanged and named schema references are resolved
+    once, at compile time.
+
+    Args:
+        schema: The Picoschema definition (dict or string).
+        schema_resolver: Optional callable to resolve named schema references.
+
+    Returns:
+        A callable that builds the equivalent JSON Schema, or None if the
+        input schema is None.
+    """
+    return _codegen(await PicoschemaParser(schema_resolver).parse(schema))
+
+
+def _codegen(schema: JsonSchema | None) -> Callable[[], JsonSchema | None]:
+    """Generates a function that builds a fresh copy of a JSON Schema.
+
+    Schemas made up solely of JSON literals are emitted as Python source.
+    Anything else, such as dates loaded from YAML frontmatter, has no literal
+    form that can be evaluated back, so the builder deep-copies a private
+    snapshot of the schema instead.
+
+    Args:
+        schema: The JSON Schema to emit as literal Python source.
+
+    Returns:
+        The generated builder function.
+    """
+    if not _is_json_literal(schema):
+        snapshot = copy.deepcopy(schema)
+        return lambda: copy.deepcopy(snapshot)
+
+    source = f'def _build():\n    return {schema!r}\n'
+    namespace: dict[str, Any] = {'inf': float('inf'), 'nan': float('nan')}
+    exec(compile(source, '<picoschema>', 'exec'), namespace)
+    return cast(Callable[[], JsonSchema | None], namespace['_build'])
+
+
+def _is_json_literal(value: Any, finite: bool = False) -> bool:
+    """Checks whether a value is built only from plain JSON types.
+
+    Exact type checks are used so that subclasses with custom reprs, such as
+    enums deriving from str, are rejected.
+
+    Args:
+        value: The value to check.
+        finite: Whether to also reject infinite and NaN floats, which JSON
+            cannot represent.
+
+    Returns:
+        True if the value is built only from dicts with string keys, lists,
+        strings, numbers, booleans and None.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return all(type(k) is str and _is_json_literal(v, finite) for k, v in value.items())
+    if value_type is list:
+        return all(_is_json_literal(item, finite) for item in value)
+    if value_type is float:
+        return not finite or math.isfinite(value)
+    return value_type in (str, int, bool, type(None))
+
+
 class PicoschemaParser:
     """Parses Picoschema definitions into JSON Schema.
 
@@ -217,6 +308,8 @@ class PicoschemaParser:
     enums, wildcards, and named schema resolution.
     """
 
+    __slots__ = ('_prefetch_errors', '_resolved', '_schema_resolver')
+
     def __init__(self, schema_resolver: SchemaResolver | None = None):
         """Initializes the PicoschemaParser.
 
@@ -224,10 +317,25 @@ class PicoschemaParser:
             schema_resolver: Optional callable to resolve named schema references.
         """
         self._schema_resolver = schema_resolver
+        self._resolved: dict[str, JsonSchema] = {}
+        # Errors raised while prefetching, re-raised when the walk reaches the
+        # offending reference instead of invoking the resolver again.
+        self._prefetch_errors: dict[str, Exception] = {}
+
+    def clear_cache(self) -> None:
+        """Clears the cache of resolved named schemas."""
+        self._resolved.clear()
+        self._prefetch_errors.clear()
 
     async def must_resolve_schema(self, schema_name: str) -> JsonSchema:
         """Resolves a named schema using the configured resolver.
 
+        Each name is resolved at most once per parser; later lookups are
+        served from a cache that holds the resolver's result as-is. Schemas
+        are only copied when a caller actually asks for them, so every call
+        returns a copy that may be modified without affecting other
+        references to the same schema.
+
         Args:
             schema_name: The name of the schema to resolve.
 
@@ -241,10 +349,14 @@ class PicoschemaParser:
         if not self._schema_resolver:
             raise ValueError(f"Picoschema: unsupported scalar type '{schema_name}'.")
 
-        val = await resolve_json_schema(schema_name, self._schema_resolver)
-        if not val:
-            raise ValueError(f"Picoschema: could not find schema with name '{schema_name}'")
-        return val
+        if schema_name not in self._resolved:
+            if (error := self._prefetch_errors.pop(schema_name, None)) is not None:
+                raise error
+            val = await resolve_json_schema(schema_name, self._schema_resolver)
+            if not val:
+                raise ValueError(f"Picoschema: could not find schema with name '{schema_name}'")
+            self._resolved[schema_name] = val
+        return _fast_deepcopy(self._resolved[schema_name])
 
     async def parse(self, schema: Any) -> JsonSchema | None:
         """Parses a schema, detecting if it's Picoschema or JSON Schema.
@@ -272,17 +384,55 @@ class PicoschemaParser:
             resolved_schema = await self.must_resolve_schema(type_name)
             return {**resolved_schema, 'description': description} if description else resolved_schema
 
-        if isinstance(schema, dict) and _is_json_schema(schema):
+        if not isinstance(schema, dict):
+            # Anything other than a string or an object is invalid Picoschema.
+            return await self._parse_pico_leaf(schema)
+
+        if _is_json_schema(schema):
             return cast(JsonSchema, schema)
 
-        if isinstance(schema, dict) and isinstance(schema.get('properties'), dict):
+        if isinstance(schema.get('properties'), dict):
             return {**cast(JsonSchema, schema), 'type': 'object'}
 
         # If the schema is not a JSON Schema, parse it as Picoschema.
-        return await self.parse_pico(schema)
+        await self._prefetch_schemas(schema)
+        return await self.parse_pico_dict(schema)
+
+    async def _prefetch_schemas(self, schema: Any) -> None:
+        """Concurrently resolves the named schemas referenced by a definition.
+
+        This only warms the cache so that parse_pico() does not wait on the
+        resolver once per reference. Only async resolvers are prefetched;
+        sync resolvers keep being called one at a time as the walk reaches
+        each reference. Failures are recorded here and raised by parse_pico()
+        when it reaches the offending reference, without calling the resolver
+        again.
+
+        Args:
+            schema: The Picoschema definition.
+        """
+        if not self._schema_resolver or not _is_async_resolver(self._schema_resolver):
+            return
+
+        names = _collect_schema_names(schema) - self._resolved.keys() - self._prefetch_errors.keys()
+        if len(names) < 2:
+            return
+
+        async def prefetch(name: str) -> None:
+            try:
+                val = await resolve_json_schema(name, self._schema_resolver)
+            except Exception as e:
+                self._prefetch_errors[name] = e
+                return
+            if val:
+                self._resolved[name] = val
+
+        async with anyio.create_task_group() as tg:
+            for name in names:
+                tg.start_soon(prefetch, name)
 
     async def parse_pico(self, obj: Any, path: list[str] | None = None) -> JsonSchema:
-        """Recursively parses a Picoschema object or string fragment.
+        """Parses a Picoschema object or string fragment.
 
         Args:
             obj: The Picoschema fragment (dict or string).
@@ -294,78 +444,249 @@ class PicoschemaParser:
         Raises:
             ValueError: If the schema structure is invalid.
         """
-        if path is None:
-            path = []
+        if not isinstance(obj, dict):
+            return await self._parse_pico_leaf(obj)
+        return await self.parse_pico_dict(obj)
 
-        if isinstance(obj, str):
-            type_name, description = extract_description(obj)
-            if type_name not in JSON_SCHEMA_SCALAR_TYPES:
-                resolved_schema = await self.must_resolve_schema(type_name)
-                return {**resolved_schema, 'description': description} if description else resolved_schema
+    async def parse_pico_dict(self, obj: dict[str, Any]) -> JsonSchema:
+        """Parses a Picoschema object definition.
 
-            if type_name == 'any':
-                return {'description': description} if description else {}
+        This is the entry point for callers that already know they hold a
+        Picoschema object, skipping the type dispatch done by `parse` and
+        `parse_pico`.
 
-            return {'type': type_name, 'description': description} if description else {'type': type_name}
-        elif not isinstance(obj, dict):
-            raise ValueError(f'Picoschema: only consists of objects and strings. Got: {obj}')
+        Nested objects are walked with an explicit stack rather than by
+        recursion, so deeply nested definitions do not grow the call stack.
 
-        schema: JsonSchema = {
-            'type': 'object',
-            'properties': {},
-            'required': [],
-            'additionalProperties': False,
-        }
-
-        for key, value in obj.items():
-            if key == WILDCARD_PROPERTY_NAME:
-                schema['additionalProperties'] = await self.parse_pico(value, [*path, key])
-                continue
-
-            parts = key.split('(')
-            name = parts[0]
-            type_info = parts[1][:-1] if len(parts) > 1 else None
-            is_optional = name.endswith('?')
-            property_name = name[:-1] if is_optional else name
-
-            if not is_optional:
-                schema['required'].append(property_name)
-
-            if not type_info:
-                prop = await self.parse_pico(value, [*path, key])
-                if is_optional and isinstance(prop.get('type'), str):
-                    prop['type'] = [prop['type'], 'null']
-                schema['properties'][property_name] = prop
-                continue
-
-            type_name, description = extract_description(type_info)
-            if type_name == 'array':
-                prop = await self.parse_pico(value, [*path, key])
-                schema['properties'][property_name] = {
-                    'type': ['array', 'null'] if is_optional else 'array',
-                    'items': prop,
-                }
-            elif type_name == 'object':
-                prop = await self.parse_pico(value, [*path, key])
-                if is_optional:
-                    prop['type'] = [prop['type'], 'null']
-                schema['properties'][property_name] = prop
-            elif type_name == 'enum':
-                prop = {'enum': value}
-                if is_optional and None not in prop['enum']:
-                    prop['enum'].append(None)
-                schema['properties'][property_name] = prop
-            else:
-                raise ValueError(f"Picoschema: parenthetical types must be 'object' or 'array', got: {type_name}")
+        Args:
+            obj: The Picoschema object definition.
 
-            if description:
-                schema['properties'][property_name]['description'] = description
+        Returns:
+            The JSON Schema for the object.
 
-        if not schema['required']:
-            del schema['required']
+        Raises:
+            ValueError: If the schema structure is invalid.
+        """
+        schema = _new_object_schema()
+        stack: list[tuple[Iterator[tuple[Any, Any]], JsonSchema]] = [(iter(obj.items()), schema)]
+        while stack:
+            items, current = stack[-1]
+            for key, value in items:
+                nested = await self._parse_pico_property(current, key, value)
+                if nested is not None:
+                    # Descend into the nested object before moving on to the
+                    # next property, matching a depth-first recursive walk.
+                    stack.append((iter(nested[1].items()), nested[0]))
+                    break
+            else:
+                stack.pop()
+                if not current['required']:
+                    del current['required']
         return schema
 
+    async def _parse_pico_leaf(self, obj: Any) -> JsonSchema:
+        """Parses a Picoschema string fragment.
+
+        Args:
+            obj: The Picoschema fragment.
 
+        Returns:
+            The JSON Schema representation of the fragment.
+
+        Raises:
+            ValueError: If the fragment is not a string.
+        """
+        if not isinstance(obj, str):
+            raise ValueError(f'Picoschema: only consists of objects and strings. Got: {obj}')
+
+        type_name, description = extract_description(obj)
+        if type_name not in JSON_SCHEMA_SCALAR_TYPES:
+            resolved_schema = await self.must_resolve_schema(type_name)
+            return {**resolved_schema, 'description': description} if description else resolved_schema
+
+        if not description:
+            return {} if type_name == 'any' else {'type': type_name}
+        if type_name == 'any':
+            return {'description': description}
+        return {'type': type_name, 'description': description}
+
+    async def _parse_pico_value(self, value: Any) -> tuple[JsonSchema, dict[str, Any] | None]:
+        """Parses the value of a Picoschema property.
+
+        Args:
+            value: The property value (dict or string).
+
+        Returns:
+            The JSON Schema for the value and, if the value is a nested object,
+            the object whose properties still need to be filled into it.
+        """
+        if isinstance(value, dict):
+            return _new_object_schema(), value
+        return await self._parse_pico_leaf(value), None
+
+    async def _parse_pico_property(
+        self, schema: JsonSchema, key: Any, value: Any
+    ) -> tuple[JsonSchema, dict[str, Any]] | None:
+        """Adds a single Picoschema property to an object schema.
+
+        Args:
+            schema: The object schema being built.
+            key: The Picoschema property key.
+            value: The Picoschema property value.
+
+        Returns:
+            The schema and Picoschema object of a nested object that still
+            needs to be walked, or None if the property is complete.
+
+        Raises:
+            ValueError: If the property is invalid.
+        """
+        if key == WILDCARD_PROPERTY_NAME:
+            prop, nested = await self._parse_pico_value(value)
+            schema['additionalProperties'] = prop
+            return (prop, nested) if nested is not None else None
+
+        property_name, is_optional, type_name, description = _split_key(key)
+
+        if not is_optional:
+            schema['required'].append(property_name)
+
+        if type_name is None:
+            prop, nested = await self._parse_pico_value(value)
+            if is_optional and isinstance(prop.get('type'), str):
+                prop['type'] = [prop['type'], 'null']
+            schema['properties'][property_name] = prop
+            return (prop, nested) if nested is not None else None
+
+        if type_name == 'array':
+            items, nested = await self._parse_pico_value(value)
+            prop = {
+                'type': ['array', 'null'] if is_optional else 'array',
+                'items': items,
+            }
+            target = items
+        elif type_name == 'object':
+            prop, nested = await self._parse_pico_value(value)
+            if is_optional:
+                prop['type'] = [prop['type'], 'null']
+            target = prop
+        elif type_name == 'enum':
+            prop = {'enum': value}
+            if is_optional and None not in prop['enum']:
+                prop['enum'].append(None)
+            target, nested = prop, None
+        else:
+            raise ValueError(f"Picoschema: parenthetical types must be 'object' or 'array', got: {type_name}")
+
+        schema['properties'][property_name] = prop
+        if description:
+            prop['description'] = description
+        return (target, nested) if nested is not None else None
+
+
+def _fast_deepcopy(schema: JsonSchema) -> JsonSchema:
+    """Deep-copies a JSON-compatible schema.
+
+    Round-trips through orjson when it is installed and the schema holds only
+    plain, finite JSON values, which is much faster than `copy.deepcopy`.
+    Anything that would not survive the round trip unchanged, such as NaN,
+    dates or non-string keys, is copied with `copy.deepcopy` instead.
+
+    Args:
+        schema: The schema to copy.
+
+    Returns:
+        An independent copy of the schema.
+    """
+    if orjson is not None and _is_json_literal(schema, finite=True):
+        try:
+            return cast(JsonSchema, orjson.loads(orjson.dumps(schema)))
+        except orjson.JSONEncodeError:
+            # Integers outside the 64-bit range.
+            pass
+    return copy.deepcopy(schema)
+
+
+def _new_object_schema() -> JsonSchema:
+    """Creates an empty JSON Schema for a Picoschema object.
+
+    Returns:
+        An object schema with no properties that disallows additional ones.
+        Its `required` list is filled in as properties are parsed and should
+        be removed if it is still empty once the object is complete.
+    """
+    return {
+        'type': 'object',
+        'properties': {},
+        'required': [],
+        'additionalProperties': False,
+    }
+
+
+def _collect_schema_names(obj: Any) -> set[str]:
+    """Collects the names of all schemas referenced by a Picoschema definition.
+
+    Args:
+        obj: The Picoschema fragment (dict or string).
+
+    Returns:
+        The set of referenced schema names.
+    """
+    names: set[str] = set()
+    pending = [obj]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, str):
+            type_name, _ = extract_description(node)
+            if type_name not in JSON_SCHEMA_SCALAR_TYPES:
+                names.add(type_name)
+        elif isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(key, str) and key != WILDCARD_PROPERTY_NAME and _split_key(key)[2] == 'enum':
+                    continue
+                pending.append(value)
+    return names
+
+
+@functools.lru_cache(maxsize=2048)
+def _split_key(key: str) -> tuple[str, bool, str | None, str | None]:
+    """Splits a Picoschema property key into its components in a single scan.
+
+    Splits a key like "name?(array, description)" into the property name,
+    whether it is optional, the parenthetical type and its description.
+
+    Args:
+        key: The Picoschema property key.
+
+    Returns:
+        A tuple of the property name, the optional flag, the parenthetical
+        type (or None) and the description (or None).
+    """
+    open_paren = key.find('(')
+    name = key if open_paren == -1 else key[:open_paren]
+    is_optional = name.endswith('?')
+    property_name = name[:-1] if is_optional else name
+    if open_paren == -1:
+        return property_name, is_optional, None, None
+
+    # The type info runs up to the next '(' (or the end of the key) and drops
+    # its last character, which is normally the closing parenthesis.
+    next_paren = key.find('(', open_paren + 1)
+    type_info = key[open_paren + 1 : next_paren - 1 if next_paren != -1 else -1]
+    if not type_info:
+        return property_name, is_optional, None, None
+
+    comma = type_info.find(',')
+    if comma == -1:
+        return property_name, is_optional, type_info, None
+    if '\n' in type_info:
+        # Defer to the regex, which does not match across lines.
+        type_name, description = extract_description(type_info)
+        return property_name, is_optional, type_name, description
+    return property_name, is_optional, type_info[:comma], type_info[comma + 1 :].lstrip(' ')
+
+
+@functools.lru_cache(maxsize=2048)
 def extract_description(input_str: str) -> tuple[str, str | None]:
     """Extracts the type/name and optional description from a Picoschema string.
 
@@ -380,7 +701,7 @@ def extract_description(input_str: str) -> tuple[str, str | None]:
     if ',' not in input_str:
         return input_str, None
 
-    match = re.match(r'(.*?), *(.*)$', input_str)
+    match = DESCRIPTION_REGEX.match(input_str)
     if match:
         return match.group(1), match.group(2)
     else:
@@ -22,13 +22,15 @@ object.
 
 ## Key Operations
 
-| Function              | Description                                                                |
-|-----------------------|----------------------------------------------------------------------------|
-| `resolve`             | Core async function to resolve a named object using a given resolver.      |
-|                       | Handles both sync/async resolvers and sync functions returning awaitables. |
-| `resolve_tool`        | Helper async function specifically for resolving tool names.               |
-| `resolve_partial`     | Helper async function specifically for resolving partial names.            |
-| `resolve_json_schema` | Helper async function specifically for resolving JSON schemas.             |
+| Function               | Description                                                                |
+|------------------------|----------------------------------------------------------------------------|
+| `resolve`              | Core async function to resolve a named object using a given resolver.      |
+|                        | Handles both sync/async resolvers and sync functions returning awaitables. |
+| `resolve_tool`         | Helper async function specifically for resolving tool names.               |
+| `resolve_partial`      | Helper async function specifically for resolving partial names.            |
+| `resolve_json_schema`  | Helper async function specifically for resolving JSON schemas.             |
+| `clear_resolver_cache` | Forgets objects cached by resolutions made with `cache=True`.              |
+| `StaticMapResolver`    | Resolver that looks names up in a fixed mapping.                           |
 
 The `resolve` function handles both sync and async resolvers. If the resolver is
 sync, it is run in a thread pool to avoid blocking the event loop. If the
@@ -39,8 +41,9 @@ the specific types of resolvers for tools, partials, and schemas.
 """
 
 import inspect
-from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, TypeVar, cast
+from weakref import WeakKeyDictionary
 
 import anyio
 
@@ -59,12 +62,104 @@ ResolverT = TypeVar('ResolverT', bound=ResolverCallable)
 DefinitionT = TypeVar('DefinitionT')
 
 
+class StaticMapResolver:
+    """A resolver that looks names up in a fixed mapping.
+
+    Names missing from the mapping resolve to None, which `resolve` reports as
+    a `LookupError`.
+    """
+
+    # '__weakref__' lets instances key the weak resolver caches below.
+    __slots__ = ('__weakref__', '_data')
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        """Initializes the resolver.
+
+        Args:
+            data: The objects to resolve, keyed by name. The mapping is copied.
+        """
+        self._data = dict(data)
+
+    def __call__(self, name: str) -> Any:
+        """Returns the object registered under a name.
+
+        Args:
+            name: The name of the object to resolve.
+
+        Returns:
+            The object, or None if the name is unknown.
+        """
+        # Lookups are expected to hit, so avoid the overhead of dict.get().
+        try:
+            return self._data[name]
+        except KeyError:
+            return None
+
+
+# Whether each resolver seen so far is an `async def` callable, so that the
+# introspection runs once per resolver rather than once per resolution.
+_ASYNC_RESOLVERS: WeakKeyDictionary[Callable[..., Any], bool] = WeakKeyDictionary()
+
+
+def _is_async_resolver(resolver: Callable[..., Any]) -> bool:
+    """Checks whether a resolver is an async callable, caching the result.
+
+    Resolvers that are unhashable or cannot be weakly referenced are
+    inspected on every call.
+
+    Args:
+        resolver: The resolver callable.
+
+    Returns:
+        True if calling the resolver returns a coroutine.
+    """
+    try:
+        return _ASYNC_RESOLVERS[resolver]
+    except KeyError:
+        pass
+    except TypeError:
+        return inspect.iscoroutinefunction(resolver)
+
+    is_async = inspect.iscoroutinefunction(resolver)
+    try:
+        _ASYNC_RESOLVERS[resolver] = is_async
+    except TypeError:
+        pass
+    return is_async
+
+
+# Objects already returned by each resolver, keyed by `(kind, name)`, for
+# calls that opt into caching.
+_RESOLVED: WeakKeyDictionary[Callable[..., Any], dict[tuple[str, str], Any]] = WeakKeyDictionary()
+
+
+def clear_resolver_cache() -> None:
+    """Forgets every object cached by `resolve(..., cache=True)`."""
+    _RESOLVED.clear()
+
+
+def _resolver_cache(resolver: Callable[..., Any]) -> dict[tuple[str, str], Any] | None:
+    """Returns the cache of resolved objects for a resolver.
+
+    Args:
+        resolver: The resolver callable.
+
+    Returns:
+        The resolver's cache, or None if the resolver is unhashable or cannot
+        be weakly referenced.
+    """
+    try:
+        return _RESOLVED.setdefault(resolver, {})
+    except TypeError:
+        return None
+
+
 # TODO: Python 3.12+:
 # async def resolve[
 #     ResolverT: ResolverCallable,
 #     DefinitionT: Any,
 # ](name: str, kind: str, resolver: ResolverT) -> DefinitionT:
-async def resolve(name: str, kind: str, resolver: ResolverT | None) -> DefinitionT:
+async def resolve(name: str, kind: str, resolver: ResolverT | None, cache: bool = False) -> DefinitionT:
     """Resolves a single object using the provided resolver.
 
     If the resolver is synchronous, it is run in a thread pool to avoid
@@ -74,6 +169,9 @@ async def resolve(name: str, kind: str, resolver: ResolverT | None) -> Definitio
         name: The name of the object to resolve.
         kind: The kind of object to resolve.
         resolver: The object resolver callable.
+        cache: Whether to reuse an object this resolver already returned for
+            the same kind and name instead of invoking it again. Failed
+            resolutions are never cached.
 
     Returns:
         The resolved object.
@@ -92,6 +190,10 @@ async def resolve(name: str, kind: str, resolver: ResolverT | None) -> Definitio
     if not callable(resolver):
         raise TypeError(f"{kind} resolver for '{name}' is not callable")
 
+    resolved = _resolver_cache(resolver) if cache else None
+    if resolved is not None and (kind, name) in resolved:
+        return cast(DefinitionT, resolved[(kind, name)])
+
     try:
         # We need to check if the callable itself is async first, or if it returns an awaitable.
         #
@@ -125,7 +227,7 @@ async def resolve(name: str, kind: str, resolver: ResolverT | None) -> Definitio
         #     | (Context Manager) |
         #     +-------------------+
         # ```
-        if inspect.iscoroutinefunction(resolver):
+        if _is_async_resolver(resolver):
             # If resolver is async, call it directly and await.
             obj = await resolver(name)
         else:
@@ -147,15 +249,18 @@ async def resolve(name: str, kind: str, resolver: ResolverT | None) -> Definitio
     if obj is None:
         raise LookupError(f"{kind} resolver for '{name}' returned None")
 
+    if resolved is not None:
+        resolved[(kind, name)] = obj
     return obj
 
 
-async def resolve_tool(name: str, resolver: ToolResolver | None) -> ToolDefinition:
+async def resolve_tool(name: str, resolver: ToolResolver | None, cache: bool = False) -> ToolDefinition:
     """Resolve a tool using the provided resolver.
 
     Args:
         name: The name of the tool to resolve.
         resolver: The tool resolver callable (sync or async).
+        cache: Whether to reuse a tool this resolver already returned.
 
     Returns:
         The resolved tool definition.
@@ -166,15 +271,16 @@ async def resolve_tool(name: str, resolver: ToolResolver | None) -> ToolDefiniti
         TypeError: If the resolver is not callable or returns an invalid type.
         ValueError: If the resolver is not defined.
     """
-    return await resolve(name, 'tool', resolver)
+    return await resolve(name, 'tool', resolver, cache)
 
 
-async def resolve_partial(name: str, resolver: PartialResolver | None) -> str:
+async def resolve_partial(name: str, resolver: PartialResolver | None, cache: bool = False) -> str:
     """Resolve a partial using the provided resolver.
 
     Args:
         name: The name of the partial to resolve.
         resolver: The partial resolver callable.
+        cache: Whether to reuse a partial this resolver already returned.
 
     Returns:
         The resolved partial.
@@ -185,15 +291,16 @@ async def resolve_partial(name: str, resolver: PartialResolver | None) -> str:
         TypeError: If the resolver is not callable or returns an invalid type.
         ValueError: If the resolver is not defined.
     """
-    return await resolve(name, 'partial', resolver)
+    return await resolve(name, 'partial', resolver, cache)
 
 
-async def resolve_json_schema(name: str, resolver: SchemaResolver | None) -> JsonSchema:
+async def resolve_json_schema(name: str, resolver: SchemaResolver | None, cache: bool = False) -> JsonSchema:
     """Resolve a JSON schema using the provided resolver.
 
     Args:
         name: The name of the JSON schema to resolve.
         resolver: The JSON schema resolver callable.
+        cache: Whether to reuse a schema this resolver already returned.
 
     Returns:
         The resolved JSON schema.
@@ -202,5 +309,6 @@ async def resolve_json_schema(name: str, resolver: SchemaResolver | None) -> Jso
         LookupError: If the resolver returns None for the schema.
         ResolverFailedError: For exceptions raised by the resolver.
         TypeError: If the resolver is not callable or returns an invalid type.
+        ValueError: If the resolver is not defined.
     """
-    return await resolve(name, 'schema', resolver)
+    return await resolve(name, 'schema', resolver, cache)
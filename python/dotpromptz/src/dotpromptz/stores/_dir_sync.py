@@ -75,10 +75,9 @@ from dotpromptz.typing import (
 )
 
 from ._io import (
-    calculate_version,
     is_partial,
     parse_prompt_filename,
-    read_prompt_file_sync,
+    read_prompt_source_sync,
     scan_directory_sync,
 )
 from ._typing import DirStoreOptions
@@ -141,8 +140,40 @@ class DirStoreSync(PromptStoreWritableSync):
         self._directory = options.directory
         # Ensure the base directory exists.
         os.makedirs(self._directory, exist_ok=True)
+        # Content of files read so far as (mtime_ns, size, source, version),
+        # keyed by path, so that unchanged files are not read and hashed again.
+        self._files: dict[str, tuple[int, int, str, str]] = {}
         logger.debug('Sync DirStore initialized', directory=str(self._directory))
 
+    def _read_file(self, file_path: Path) -> tuple[str, str]:
+        """Reads a prompt file and its version, reusing them while unchanged.
+
+        A file counts as unchanged while its modification time and size stay
+        the same. Files written or deleted through the store are always read
+        again.
+
+        Args:
+            file_path: The full path to the prompt file.
+
+        Returns:
+            A tuple of the file content and its version.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            OSError: If there's an error reading the file.
+        """
+        # Stat before reading, so that a concurrent write leaves a stale key
+        # rather than stale content.
+        stat = os.stat(file_path)
+        key = str(file_path)
+        cached = self._files.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], cached[3]
+
+        source, version = read_prompt_source_sync(file_path)
+        self._files[key] = (stat.st_mtime_ns, stat.st_size, source, version)
+        return source, version
+
     def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
         """Synchronously lists available prompts (excluding partials).
 
@@ -170,9 +201,7 @@ class DirStoreSync(PromptStoreWritableSync):
                     else:
                         full_name = parsed.name
 
-                    full_file_path = self._directory / file_rel_path
-                    content = read_prompt_file_sync(full_file_path)
-                    version = calculate_version(content)
+                    _, version = self._read_file(self._directory / file_rel_path)
                     prompts.append(
                         PromptRef(
                             name=full_name,
@@ -230,9 +259,7 @@ class DirStoreSync(PromptStoreWritableSync):
                     else:
                         full_name = parsed.name
 
-                    full_file_path = self._directory / file_rel_path
-                    content = read_prompt_file_sync(full_file_path)
-                    version = calculate_version(content)
+                    _, version = self._read_file(self._directory / file_rel_path)
                     partials.append(
                         PartialRef(
                             name=full_name,
@@ -292,8 +319,7 @@ class DirStoreSync(PromptStoreWritableSync):
         )
 
         try:
-            source = read_prompt_file_sync(file_path)
-            version = calculate_version(source)
+            source, version = self._read_file(file_path)
 
             if version_opt and version_opt != version:
                 err_msg = (
@@ -356,8 +382,7 @@ class DirStoreSync(PromptStoreWritableSync):
         )
 
         try:
-            source = read_prompt_file_sync(file_path)
-            version = calculate_version(source)
+            source, version = self._read_file(file_path)
 
             if version_opt and version_opt != version:
                 err_msg = (
@@ -425,9 +450,10 @@ class DirStoreSync(PromptStoreWritableSync):
             os.makedirs(file_dir, exist_ok=True)
             logger.debug('Ensured directory exists (sync)', directory=str(file_dir))
 
-            # Write the prompt source content synchronously.
-            with open(file_path, mode='w', encoding='utf-8') as f:
-                f.write(prompt.source)
+            # Write the prompt source content synchronously, encoding it in
+            # one step rather than through a text-mode file wrapper.
+            self._files.pop(str(file_path), None)
+            file_path.write_bytes(prompt.source.encode('utf-8'))
             logger.info('Prompt saved successfully (sync)', path=str(file_path))
         except OSError as e:
             err_msg = f"Failed to save prompt '{prompt.name}' to {file_path} due to OS error: {e}"
@@ -463,9 +489,6 @@ class DirStoreSync(PromptStoreWritableSync):
             self._directory / dir_name / partial_file_name if dir_name else self._directory / partial_file_name
         )
 
-        file_to_delete: Path | None = None
-        item_type = 'item'
-
         logger.debug(
             'Attempting to delete (sync)',
             name=name,
@@ -474,41 +497,14 @@ class DirStoreSync(PromptStoreWritableSync):
             partial_path=str(partial_file_path),
         )
 
-        try:
-            if prompt_file_path.exists():
-                file_to_delete = prompt_file_path
-                item_type = 'prompt'
-            elif partial_file_path.exists():
-                file_to_delete = partial_file_path
-                item_type = 'partial'
-        except OSError as e:
-            logger.error(
-                'OS Error checking file existence during delete (sync)',
-                name=name,
-                variant=variant,
-                error=str(e),
-            )
-            raise OSError(
-                f"OS Error checking existence for '{name}'{f' (variant: {variant})' if variant else ''}: {e}"
-            ) from e
-        except Exception as e:
-            logger.error(
-                'Unexpected error checking file existence during delete (sync)',
-                name=name,
-                variant=variant,
-                error=str(e),
-            )
-            raise RuntimeError(
-                f"Unexpected error checking existence for '{name}'{f' (variant: {variant})' if variant else ''}: {e}"
-            ) from e
-
-        if file_to_delete:
+        # Remove the prompt, falling back to the partial, without checking
+        # for existence first; a missing file is reported by the removal.
+        for file_to_delete, item_type in ((prompt_file_path, 'prompt'), (partial_file_path, 'partial')):
             try:
+                self._files.pop(str(file_to_delete), None)
                 os.remove(file_to_delete)
-                logger.info(
-                    f'{item_type.capitalize()} deleted successfully (sync)',
-                    path=str(file_to_delete),
-                )
+            except FileNotFoundError:
+                continue
             except OSError as e:
                 err_msg = (
                     f"Failed to delete {item_type} '{name}'"
@@ -525,12 +521,18 @@ class DirStoreSync(PromptStoreWritableSync):
                 )
                 logger.error(err_msg)
                 raise RuntimeError(err_msg) from e
-        else:
-            err_msg = (
-                f"Failed to delete '{name}'"
-                f'{f" (variant: {variant})" if variant else ""}:'
-                f' File not found at expected paths {prompt_file_path}'
-                f' or {partial_file_path}'
+
+            logger.info(
+                f'{item_type.capitalize()} deleted successfully (sync)',
+                path=str(file_to_delete),
             )
-            logger.error(err_msg)
-            raise FileNotFoundError(err_msg)
+            return
+
+        err_msg = (
+            f"Failed to delete '{name}'"
+            f'{f" (variant: {variant})" if variant else ""}:'
+            f' File not found at expected paths {prompt_file_path}'
+            f' or {partial_file_path}'
+        )
+        logger.error(err_msg)
+        raise FileNotFoundError(err_msg)
@@ -23,6 +23,7 @@ and scanning directories for prompt files.
 
 Key Functions:
 - read_prompt_file_sync/async: Read prompt file contents
+- read_prompt_source_sync: Read prompt file contents along with their version
 - calculate_version: Generate a stable version identifier from content
 - parse_prompt_filename: Extract name and variant from filename
 - is_partial: Determine if a filename represents a partial
@@ -70,6 +71,41 @@ def read_prompt_file_sync(file_path: Path) -> str:
         raise
 
 
+def read_prompt_source_sync(file_path: Path) -> tuple[str, str]:
+    """Synchronously reads a prompt file and calculates its version.
+
+    The file is read as bytes and decoded once. When it has no carriage
+    returns, which is the common case, the version is hashed from the bytes
+    that were read rather than from a re-encoded string. Line endings are
+    normalized as in `read_prompt_file_sync`, so both yield the same content.
+
+    Args:
+        file_path: The full path to the prompt file.
+
+    Returns:
+        A tuple of the file content as a string and its version.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        OSError: If there's an error reading the file.
+    """
+    logger.debug('Reading prompt file (sync)', path=str(file_path))
+    try:
+        data = file_path.read_bytes()
+    except FileNotFoundError:
+        logger.error('File not found (sync)', path=str(file_path))
+        raise
+    except OSError as e:
+        logger.error('Error reading file (sync)', path=str(file_path), error=str(e))
+        raise
+
+    if b'\r' in data:
+        # Match the universal newline translation of text-mode reads.
+        source = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        return source, calculate_version(source)
+    return data.decode('utf-8'), calculate_version(data)
+
+
 async def read_prompt_file_async(file_path: Path) -> str:
     """Asynchronously reads the content of a prompt file.
 
@@ -97,14 +133,15 @@ async def read_prompt_file_async(file_path: Path) -> str:
         raise
 
 
-def calculate_version(content: str) -> str:
+def calculate_version(content: str | bytes) -> str:
     """Calculate a deterministic version identifier for a prompt.
 
     Generates a version hash based on the content of the prompt or partial.
     This enables version checking and comparison.
 
     Args:
-        content: The string content to hash.
+        content: The content to hash, either as a string or already encoded
+            as UTF-8 bytes, which hash to the same version.
 
     Returns:
         A SHA1 hash string representing the version.
@@ -115,7 +152,9 @@ def calculate_version(content: str) -> str:
         # Returns a string like: "a123b456c789d0ef"
         ```
     """
-    sha1 = hashlib.sha1(content.encode('utf-8'), usedforsecurity=False)
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    sha1 = hashlib.sha1(content, usedforsecurity=False)
     return sha1.hexdigest()[:8]
 
 
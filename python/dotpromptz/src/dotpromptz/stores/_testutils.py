@@ -34,6 +34,22 @@ import os
 from pathlib import Path
 
 
+def _write_file(file_path: Path, content: str) -> None:
+    """Write content to a file as UTF-8, bypassing buffered text I/O.
+
+    Args:
+        file_path: Path of the file to create or truncate.
+        content: The content to write.
+    """
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
 def create_test_prompt(
     directory: Path,
     name: str,
@@ -88,8 +104,7 @@ def create_test_prompt(
 
     # Create the file.
     file_path = full_dir / file_name
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    _write_file(file_path, content)
 
     return file_path
 
@@ -154,7 +169,6 @@ def create_test_partial(
 
     # Create the file.
     file_path = full_dir / file_name
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    _write_file(file_path, content)
 
     return file_path
@@ -16,6 +16,7 @@
 
 """Utility functions for dotpromptz."""
 
+import sys
 from typing import Any
 
 
@@ -33,23 +34,49 @@ def remove_undefined_fields(obj: Any) -> Any:
     Returns:
         The object with undefined fields removed.
     """
-    if obj is None or not isinstance(obj, dict | list):
+    if not isinstance(obj, dict | list):
         return obj
 
-    # Lists.
-    if isinstance(obj, list):
-        return [remove_undefined_fields(item) for item in obj if item is not None]
+    # Copy containers level by level from an explicit stack rather than
+    # recursing, which saves a Python call per nested value.
+    root = _without_none(obj)
+    stack: list[tuple[dict[Any, Any] | list[Any], int]] = [(root, 1)]
+    limit = sys.getrecursionlimit()
+    while stack:
+        container, depth = stack.pop()
+        if depth > limit:
+            # Fail on cyclic input the way the recursive version did.
+            raise RecursionError('maximum nesting depth exceeded while removing undefined fields')
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            if isinstance(value, dict | list):
+                # Replacing the value under an existing key is safe mid-iteration.
+                child = _without_none(value)
+                container[key] = child
+                stack.append((child, depth + 1))
+    return root
+
+
+def _without_none(obj: dict[Any, Any] | list[Any]) -> dict[Any, Any] | list[Any]:
+    """Returns a shallow copy of a container without its None values.
 
-    # Dicts.
-    result = {}
-    for key, value in obj.items():
-        if value is not None:
-            result[key] = remove_undefined_fields(value)
-    return result
+    Args:
+        obj: The dictionary or list to copy.
+
+    Returns:
+        A new dictionary without the keys mapped to None, or a new list
+        without the None elements.
+    """
+    if isinstance(obj, list):
+        return [item for item in obj if item is not None]
+    return {key: value for key, value in obj.items() if value is not None}
 
 
 _QUOTE_PAIRS: set[tuple[str, str]] = {('"', '"'), ("'", "'")}
 
+# The characters that open and close each of the default quote pairs.
+_QUOTE_CHARS = frozenset(start for start, _ in _QUOTE_PAIRS)
+
 
 def unquote(value: str, pairs: set[tuple[str, str]] | None = None) -> str:
     """Remove quotes from a string literal representation.
@@ -62,10 +89,14 @@ def unquote(value: str, pairs: set[tuple[str, str]] | None = None) -> str:
     Returns:
         The string with quotes removed.
     """
+    str_value = str(value)
     if pairs is None:
-        pairs = _QUOTE_PAIRS
+        # The default pairs are single matching characters, so compare the
+        # first and last characters directly instead of looping over pairs.
+        if str_value and str_value[0] == str_value[-1] and str_value[0] in _QUOTE_CHARS:
+            return str_value[1:-1]
+        return str_value
 
-    str_value = str(value)
     for start, end in pairs:
         if str_value.startswith(start) and str_value.endswith(end):
             return str_value[len(start) : -len(end)]
@@ -16,10 +16,17 @@
 
 """Tests for picoschema functionality."""
 
+import asyncio
+import datetime
+import importlib.util
+import json
+import math
 import unittest
 from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock, patch
 
 from dotpromptz import picoschema
+from dotpromptz.errors import ResolverFailedError
 from dotpromptz.typing import JsonSchema
 
 
@@ -42,6 +49,71 @@ class TestPicoschemaParser(IsolatedAsyncioTestCase):
         resolved = await parser_with_resolver.must_resolve_schema('MySchema')
         self.assertEqual(resolved, {'type': 'string', 'description': 'Resolved schema'})
 
+    async def test_must_resolve_schema_caches_result(self) -> None:
+        """Test that a named schema is resolved only once per parser."""
+        calls: list[str] = []
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            calls.append(name)
+            return {'type': 'string'}
+
+        parser = picoschema.PicoschemaParser(schema_resolver=mock_resolver)
+        result = await parser.parse_pico({'first?': 'MySchema', 'second': 'MySchema'})
+        self.assertEqual(calls, ['MySchema'])
+        self.assertEqual(result['properties']['first'], {'type': ['string', 'null']})
+        self.assertEqual(result['properties']['second'], {'type': 'string'})
+
+        parser.clear_cache()
+        await parser.must_resolve_schema('MySchema')
+        self.assertEqual(calls, ['MySchema', 'MySchema'])
+
+    async def test_parse_resolves_named_schemas_concurrently(self) -> None:
+        """Test that named schemas are resolved concurrently before parsing."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'type': 'string', 'description': name}
+
+        parser = picoschema.PicoschemaParser(schema_resolver=mock_resolver)
+        result = await parser.parse({'a': 'First', 'b(object)': {'c': 'Second'}, 'd(enum)': ['Third']})
+        self.assertEqual(max_in_flight, 2)
+        assert result is not None
+        self.assertEqual(result['properties']['a'], {'type': 'string', 'description': 'First'})
+        self.assertEqual(result['properties']['b']['properties']['c'], {'type': 'string', 'description': 'Second'})
+
+    async def test_parse_prefetch_failure_calls_resolver_once(self) -> None:
+        """Test that a schema that fails to prefetch is not resolved again."""
+        calls: list[str] = []
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            calls.append(name)
+            if name == 'Broken':
+                raise RuntimeError('boom')
+            return {'type': 'string'}
+
+        parser = picoschema.PicoschemaParser(schema_resolver=mock_resolver)
+        with self.assertRaises(ResolverFailedError):
+            await parser.parse({'a': 'Working', 'b': 'Broken'})
+        self.assertEqual(sorted(calls), ['Broken', 'Working'])
+
+    async def test_parse_does_not_prefetch_sync_resolvers(self) -> None:
+        """Test that sync resolvers are called in walk order, one at a time."""
+        calls: list[str] = []
+
+        def mock_resolver(name: str) -> JsonSchema | None:
+            calls.append(name)
+            return {'type': 'string'}
+
+        parser = picoschema.PicoschemaParser(schema_resolver=mock_resolver)
+        await parser.parse({'a': 'First', 'b(object)': {'c': 'Second'}, 'd': 'Third'})
+        self.assertEqual(calls, ['First', 'Second', 'Third'])
+
     async def test_must_resolve_schema_not_found(self) -> None:
         """Test resolving a non-existent schema."""
 
@@ -252,6 +324,19 @@ class TestPicoschemaParser(IsolatedAsyncioTestCase):
         result = await self.parser.parse_pico(schema)
         self.assertEqual(result, expected)
 
+    async def test_parse_pico_dict(self) -> None:
+        """Test that parse_pico_dict matches parse_pico for objects."""
+        schema = {'name': 'string', 'tags?(array)': 'string', 'address': {'city': 'string'}}
+        self.assertEqual(await self.parser.parse_pico_dict(schema), await self.parser.parse_pico(schema))
+
+    async def test_parse_pico_required_in_declaration_order(self) -> None:
+        """Test that required properties are listed in declaration order."""
+        schema = {'b': 'string', 'a?': 'string', 'd(array)': 'string', 'c(object)': {'x?': 'string'}}
+        result = await self.parser.parse_pico(schema)
+        self.assertEqual(list(result), ['type', 'properties', 'required', 'additionalProperties'])
+        self.assertEqual(result['required'], ['b', 'd', 'c'])
+        self.assertNotIn('required', result['properties']['c'])
+
     async def test_parse_pico_description_on_type(self) -> None:
         """Test parsing Picoschema with descriptions on types."""
         schema = {'name': 'string, a name'}
@@ -321,6 +406,159 @@ class TestPicoschemaParser(IsolatedAsyncioTestCase):
         with self.assertRaises(ValueError):
             await self.parser.parse_pico(123)
 
+    async def test_parse_pico_empty_parenthetical_type(self) -> None:
+        """Test error on a parenthetical with a description but no type."""
+        for key in ['name(, the name)', 'name(,)']:
+            with self.assertRaises(ValueError) as context:
+                await self.parser.parse_pico({key: 'string'})
+            self.assertIn("parenthetical types must be 'object' or 'array', got: ", str(context.exception))
+
+    async def test_parse_returns_independent_schemas(self) -> None:
+        """Test that repeated parses return equal but independent schemas."""
+        schema = {'name': 'string', 'tags?(array)': 'string'}
+        first = await self.parser.parse(schema)
+        second = await picoschema.PicoschemaParser().parse(dict(schema))
+        assert first is not None
+        assert second is not None
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertIsNot(first['properties']['tags'], second['properties']['tags'])
+
+    async def test_parse_returns_independent_scalar_leaves(self) -> None:
+        """Test that modifying a parsed scalar leaf does not affect later parses."""
+        result = await picoschema.picoschema_to_json_schema({'name': 'string', 'nick?': 'string'})
+        assert result is not None
+        result['properties']['name']['description'] = 'changed'
+        result['properties']['nick']['type'].append('number')
+
+        other = await picoschema.picoschema_to_json_schema({'other': 'string', 'alias?': 'string'})
+        assert other is not None
+        self.assertEqual(other['properties']['other'], {'type': 'string'})
+        self.assertEqual(other['properties']['alias'], {'type': ['string', 'null']})
+
+    async def test_parse_pico_identical_objects_are_independent(self) -> None:
+        """Test that identical nested objects are parsed into separate schemas."""
+        schema = {
+            'home': {'street': 'string'},
+            'work(object)': {'street': 'string'},
+        }
+        result = await self.parser.parse_pico(schema)
+        properties = result['properties']
+        self.assertEqual(properties['home'], properties['work'])
+        self.assertIsNot(properties['home'], properties['work'])
+        properties['home']['properties']['street']['description'] = 'changed'
+        self.assertEqual(properties['work']['properties'], {'street': {'type': 'string'}})
+
+
+class TestFastDeepcopy(unittest.TestCase):
+    """Tests for copying resolved schemas."""
+
+    def test_fast_deepcopy(self) -> None:
+        """Test that copies are equal but independent."""
+        schema = {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+        result = picoschema._fast_deepcopy(schema)
+        self.assertEqual(result, schema)
+        self.assertIsNot(result['properties'], schema['properties'])
+
+    def test_fast_deepcopy_non_json_keys(self) -> None:
+        """Test that values orjson cannot serialize are still copied."""
+        schema = {'enum': {1: 'one'}}
+        result = picoschema._fast_deepcopy(schema)
+        self.assertEqual(result, schema)
+        self.assertIsNot(result['enum'], schema['enum'])
+
+    @unittest.skipIf(importlib.util.find_spec('orjson') is None, 'orjson is not installed')
+    def test_fast_deepcopy_with_orjson(self) -> None:
+        """Test copying through the installed orjson package."""
+        schema = {
+            'type': 'object',
+            'properties': {'name': {'type': 'string', 'enum': ['a', None], 'maximum': 1.5}},
+            'examples': [{'date': datetime.date(2024, 4, 9)}],
+        }
+        plain = {'type': 'object', 'properties': schema['properties']}
+        result = picoschema._fast_deepcopy(plain)
+        self.assertEqual(result, plain)
+        self.assertIsNot(result['properties'], plain['properties'])
+
+        result = picoschema._fast_deepcopy(schema)
+        self.assertEqual(result['examples'], [{'date': datetime.date(2024, 4, 9)}])
+        self.assertEqual(picoschema._fast_deepcopy({'minimum': 2**70}), {'minimum': 2**70})
+
+    def test_fast_deepcopy_preserves_non_json_values(self) -> None:
+        """Test that values JSON cannot represent are copied unchanged."""
+        loads = Mock(side_effect=json.loads)
+        fake_orjson = Mock(dumps=lambda value: json.dumps(value).encode(), loads=loads, JSONEncodeError=TypeError)
+        schema = {'default': float('nan'), 'examples': [datetime.date(2024, 4, 9)], 'maximum': float('inf')}
+        with patch.object(picoschema, 'orjson', fake_orjson):
+            result = picoschema._fast_deepcopy(schema)
+            plain = picoschema._fast_deepcopy({'type': 'string'})
+        self.assertTrue(math.isnan(result['default']))
+        self.assertEqual(result['examples'], [datetime.date(2024, 4, 9)])
+        self.assertEqual(result['maximum'], float('inf'))
+        self.assertEqual(plain, {'type': 'string'})
+        loads.assert_called_once()
+
+
+class TestCompilePico(IsolatedAsyncioTestCase):
+    """Compiled Picoschema builder tests."""
+
+    async def test_compile_pico(self) -> None:
+        """Test that a compiled builder returns fresh copies of the schema."""
+        schema = {'name': 'string, the name', 'address(object)': {'street': 'string'}}
+        build = await picoschema.compile_pico(schema)
+        expected = await picoschema.PicoschemaParser().parse_pico(schema)
+        first = build()
+        assert first is not None
+        self.assertEqual(first, expected)
+        first['properties']['name']['type'] = 'number'
+        self.assertEqual(build(), expected)
+
+    async def test_compile_pico_json_schema(self) -> None:
+        """Test that JSON Schema input is compiled unchanged."""
+        schema: JsonSchema = {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+        build = await picoschema.compile_pico(schema)
+        first = build()
+        self.assertEqual(first, schema)
+        self.assertIsNot(first, schema)
+        self.assertEqual(first, await picoschema.picoschema_to_json_schema(schema))
+
+    async def test_compile_pico_none(self) -> None:
+        """Test that a None schema compiles to a builder returning None."""
+        build = await picoschema.compile_pico(None)
+        self.assertIsNone(build())
+
+    async def test_compile_pico_resolves_named_schemas(self) -> None:
+        """Test that named schemas are resolved when compiling."""
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            return {'type': 'integer'} if name == 'CustomType' else None
+
+        build = await picoschema.compile_pico({'count': 'CustomType'}, mock_resolver)
+        self.assertEqual(
+            build(),
+            {
+                'type': 'object',
+                'properties': {'count': {'type': 'integer'}},
+                'required': ['count'],
+                'additionalProperties': False,
+            },
+        )
+
+    async def test_compile_pico_non_json_values(self) -> None:
+        """Test that values without a literal form are copied rather than emitted."""
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            return {'type': 'string', 'default': datetime.date(2024, 4, 9)} if name == 'Day' else None
+
+        build = await picoschema.compile_pico({'day': 'Day'}, mock_resolver)
+        first = build()
+        assert first is not None
+        self.assertEqual(first['properties']['day'], {'type': 'string', 'default': datetime.date(2024, 4, 9)})
+        first['properties']['day']['default'] = None
+        second = build()
+        assert second is not None
+        self.assertEqual(second['properties']['day']['default'], datetime.date(2024, 4, 9))
+
 
 class TestExtractDescription(unittest.TestCase):
     """Extract description tests."""
@@ -339,6 +577,34 @@ class TestExtractDescription(unittest.TestCase):
         result = picoschema.extract_description(input_str)
         self.assertEqual(result, expected)
 
+    def test_extract_is_cached(self) -> None:
+        """Test that repeated extractions are served from the cache."""
+        picoschema.extract_description.cache_clear()
+        picoschema.extract_description('string, cached')
+        picoschema.extract_description('string, cached')
+        self.assertEqual(picoschema.extract_description.cache_info().hits, 1)
+
+
+class TestSplitKey(unittest.TestCase):
+    """Property key parsing tests."""
+
+    def test_parse_plain_key(self) -> None:
+        """Test parsing a key without markers."""
+        self.assertEqual(picoschema._split_key('name'), ('name', False, None, None))
+
+    def test_parse_key_with_markers(self) -> None:
+        """Test parsing a key with optional and parenthetical markers."""
+        self.assertEqual(
+            picoschema._split_key('items?(array, list of items)'),
+            ('items', True, 'array', 'list of items'),
+        )
+
+    def test_split_key_matches_description_regex(self) -> None:
+        """Test that the type info split agrees with extract_description."""
+        for type_info in ['enum', 'enum,', 'object,  spaced out', 'array, a, b', ', desc', ',']:
+            _, _, type_name, description = picoschema._split_key(f'field({type_info})')
+            self.assertEqual((type_name, description), picoschema.extract_description(type_info))
+
 
 if __name__ == '__main__':
     unittest.main()
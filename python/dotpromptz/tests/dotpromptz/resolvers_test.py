@@ -14,7 +14,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-"""Unit tests for resolver utilities using unittest.
+"""Unit tests for resolver utilities.
 
 ## `resolve`
 
@@ -37,28 +37,25 @@
 """
 
 import asyncio
-import unittest
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import pytest
+
 from dotpromptz.errors import ResolverFailedError
-from dotpromptz.resolvers import resolve, resolve_json_schema, resolve_partial, resolve_tool
+from dotpromptz.resolvers import (
+    _ASYNC_RESOLVERS,
+    StaticMapResolver,
+    clear_resolver_cache,
+    resolve,
+    resolve_json_schema,
+    resolve_partial,
+    resolve_tool,
+)
 from dotpromptz.typing import JsonSchema, ToolDefinition
 
-
-class MockSyncResolver:
-    """Mock sync resolver callable."""
-
-    def __init__(self, data: dict[str, Any], error: Exception | None = None) -> None:
-        """Initialize the mock sync resolver."""
-        self._data = data
-        self._error = error
-
-    def __call__(self, name: str) -> Any:
-        """Mock sync resolver callable."""
-        if self._error:
-            raise self._error
-        return self._data.get(name)
+# Run every test on one shared event loop instead of creating one per test.
+pytestmark = pytest.mark.asyncio(loop_scope='session')
 
 
 async def _async_helper(value: Any) -> Any:
@@ -67,56 +64,70 @@ async def _async_helper(value: Any) -> Any:
     return value
 
 
-class MockSyncReturningAwaitableResolver:
-    """Mock sync resolver that returns an awaitable (coroutine)."""
+def make_resolver(kind: str, data: dict[str, Any], error: Exception | None = None) -> Callable[[str], Any]:
+    """Creates a mock resolver over a mapping.
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        """Initialize the mock resolver."""
-        self._data = data
+    Missing names resolve to None. The resolver reads `data` on every call, so
+    later changes to the mapping are visible to it.
 
-    def __call__(self, name: str) -> Awaitable[Any] | None:
-        """Return a coroutine object if name is found."""
-        value = self._data.get(name)
-        if value is not None:
-            # Calling the async helper returns the awaitable coroutine
-            return _async_helper(value)
-        return None
+    Args:
+        kind: One of 'sync', 'async', 'sync_awaitable' (a sync callable
+            returning a coroutine) or 'sync_future' (a sync callable returning
+            an `asyncio.Future` bound to the running loop).
+        data: The objects to resolve, keyed by name.
+        error: An exception for 'sync' and 'async' resolvers to raise instead.
 
+    Returns:
+        The resolver callable.
+    """
+    if kind == 'sync':
 
-class MockSyncReturningFutureResolver:
-    """Mock sync resolver that returns an asyncio.Future."""
+        def sync_resolver(name: str) -> Any:
+            if error:
+                raise error
+            try:
+                return data[name]
+            except KeyError:
+                return None
 
-    def __init__(self, data: dict[str, Any], loop: asyncio.AbstractEventLoop) -> None:
-        """Initialize the mock resolver."""
-        self._data = data
-        self._loop = loop
+        return sync_resolver
 
-    def __call__(self, name: str) -> asyncio.Future[Any] | None:
-        """Return a future object if name is found."""
-        value = self._data.get(name)
-        if value is not None:
-            future: asyncio.Future[Any] = self._loop.create_future()
-            # Use call_soon_threadsafe to set the result in the event loop.
-            self._loop.call_soon_threadsafe(future.set_result, value)
-            return future
-        return None
+    if kind == 'async':
+
+        async def async_resolver(name: str) -> Any:
+            if error:
+                raise error
+            # Yield to the event loop to simulate an async operation.
+            await asyncio.sleep(0)
+            return data.get(name)
+
+        return async_resolver
+
+    if kind == 'sync_awaitable':
+
+        def sync_awaitable_resolver(name: str) -> Awaitable[Any] | None:
+            value = data.get(name)
+            # Calling the async helper returns the awaitable coroutine.
+            return _async_helper(value) if value is not None else None
+
+        return sync_awaitable_resolver
 
+    if kind == 'sync_future':
+        # Sync resolvers run in a worker thread, so capture the loop here.
+        loop = asyncio.get_running_loop()
 
-class MockAsyncResolver:
-    """Mock async resolver callable."""
+        def sync_future_resolver(name: str) -> asyncio.Future[Any] | None:
+            value = data.get(name)
+            if value is None:
+                return None
+            future: asyncio.Future[Any] = loop.create_future()
+            # Use call_soon_threadsafe to set the result in the event loop.
+            loop.call_soon_threadsafe(future.set_result, value)
+            return future
 
-    def __init__(self, data: dict[str, Any], error: Exception | None = None) -> None:
-        """Initialize the mock async resolver."""
-        self._data = data
-        self._error = error
+        return sync_future_resolver
 
-    async def __call__(self, name: str) -> Any:
-        """Mock async resolver callable."""
-        if self._error:
-            raise self._error
-        # Simulate async operation.
-        await asyncio.sleep(0.1)
-        return self._data.get(name)
+    raise ValueError(f'unknown resolver kind: {kind}')
 
 
 mock_tool_def = ToolDefinition(name='test_tool', inputSchema={})
@@ -124,133 +135,209 @@ mock_partial_content = 'This is a partial.'
 mock_json_schema: JsonSchema = {'type': 'string', 'description': 'A test schema'}
 
 
-class TestResolve(unittest.IsolatedAsyncioTestCase):
-    """Tests for resolver functions."""
-
-    async def test_resolve_resolver_none(self) -> None:
-        """Test ValueError when resolver is None."""
-        with self.assertRaisesRegex(ValueError, 'test resolver is not defined'):
-            await resolve('obj', 'test', None)
-
-    async def test_resolve_sync_success(self) -> None:
-        """Test successful resolution with a sync resolver."""
-        resolver = MockSyncResolver({'obj1': 'value1'})
-        result: Any = await resolve('obj1', 'test', resolver)
-        self.assertEqual(result, 'value1')
-
-    async def test_resolve_async_success(self) -> None:
-        """Test successful resolution with an async resolver."""
-        resolver = MockAsyncResolver({'obj2': 'value2'})
-        result: Any = await resolve('obj2', 'test', resolver)
-        self.assertEqual(result, 'value2')
-
-    async def test_resolve_sync_resolver_returns_awaitable(self) -> None:
-        """Test successful resolution with a sync resolver returning an awaitable."""
-        resolver = MockSyncReturningAwaitableResolver({'obj_await': 'value_await'})
-        result: Any = await resolve('obj_await', 'test', resolver)
-        self.assertEqual(result, 'value_await')
-
-        # Test case where the sync resolver returns None via awaitable
-        resolver_none = MockSyncReturningAwaitableResolver({})
-        with self.assertRaisesRegex(LookupError, "test resolver for 'not_found' returned None"):
-            await resolve('not_found', 'test', resolver_none)
-
-    async def test_resolve_resolver_not_callable(self) -> None:
-        """Test TypeError when resolver is not callable."""
-        with self.assertRaisesRegex(TypeError, "test resolver for 'obj' is not callable"):
-            await resolve('obj', 'test', 'not_a_callable')  # type: ignore
-
-    async def test_resolve_resolver_returns_none(self) -> None:
-        """Test LookupError when resolver returns None."""
-        resolver_sync = MockSyncResolver({})
-        resolver_async = MockAsyncResolver({})
-        with self.assertRaisesRegex(LookupError, "test resolver for 'not_found' returned None"):
-            await resolve('not_found', 'test', resolver_sync)
-        with self.assertRaisesRegex(LookupError, "test resolver for 'not_found' returned None"):
-            await resolve('not_found', 'test', resolver_async)
-
-    async def test_resolve_sync_resolver_raises_error(self) -> None:
-        """Test ResolverFailedError when sync resolver raises an error."""
-        original_error = ValueError('Sync resolver error')
-        resolver = MockSyncResolver({}, error=original_error)
-        with self.assertRaisesRegex(ResolverFailedError, r'test resolver failed for obj; Sync resolver error') as cm:
-            await resolve('obj', 'test', resolver)
-        self.assertIs(cm.exception.__cause__, original_error)
-
-    async def test_resolve_async_resolver_raises_error(self) -> None:
-        """Test ResolverFailedError when async resolver raises an error."""
-        original_error = KeyError('Async resolver error')
-        resolver = MockAsyncResolver({}, error=original_error)
-        with self.assertRaisesRegex(ResolverFailedError, r"test resolver failed for obj; 'Async resolver error'") as cm:
-            await resolve('obj', 'test', resolver)
-        self.assertIs(cm.exception.__cause__, original_error)
-
-    async def test_resolve_sync_resolver_returns_future(self) -> None:
-        """Test successful resolution with a sync resolver returning a Future."""
-        loop = asyncio.get_running_loop()
-        resolver = MockSyncReturningFutureResolver({'obj_future': 'value_future'}, loop)
-        result: str = await resolve('obj_future', 'test', resolver)
-        self.assertEqual(result, 'value_future')
+async def test_resolve_resolver_none() -> None:
+    """Test ValueError when resolver is None."""
+    with pytest.raises(ValueError) as excinfo:
+        await resolve('obj', 'test', None)
+    assert str(excinfo.value) == 'test resolver is not defined'
+
+
+@pytest.mark.parametrize(
+    ('kind', 'name', 'value'),
+    [
+        ('sync', 'obj1', 'value1'),
+        ('async', 'obj2', 'value2'),
+        ('sync_awaitable', 'obj_await', 'value_await'),
+        ('sync_future', 'obj_future', 'value_future'),
+    ],
+)
+async def test_resolve_success(kind: str, name: str, value: str) -> None:
+    """Test successful resolution with each kind of resolver."""
+    resolver = make_resolver(kind, {name: value})
+    result: Any = await resolve(name, 'test', resolver)
+    assert result == value
+
+
+async def test_resolve_sync_resolver_returns_awaitable_none() -> None:
+    """Test LookupError when a sync resolver returning an awaitable finds nothing."""
+    resolver_none = make_resolver('sync_awaitable', {})
+    with pytest.raises(LookupError) as excinfo:
+        await resolve('not_found', 'test', resolver_none)
+    assert str(excinfo.value) == "test resolver for 'not_found' returned None"
+
+
+async def test_resolve_resolver_not_callable() -> None:
+    """Test TypeError when resolver is not callable."""
+    with pytest.raises(TypeError) as excinfo:
+        await resolve('obj', 'test', 'not_a_callable')  # type: ignore
+    assert str(excinfo.value) == "test resolver for 'obj' is not callable"
+
+
+async def test_resolve_resolver_returns_none() -> None:
+    """Test LookupError when resolver returns None."""
+    resolver_sync = make_resolver('sync', {})
+    resolver_async = make_resolver('async', {})
+    with pytest.raises(LookupError) as excinfo:
+        await resolve('not_found', 'test', resolver_sync)
+    assert str(excinfo.value) == "test resolver for 'not_found' returned None"
+    with pytest.raises(LookupError) as excinfo:
+        await resolve('not_found', 'test', resolver_async)
+    assert str(excinfo.value) == "test resolver for 'not_found' returned None"
+
+
+async def test_resolve_sync_resolver_raises_error() -> None:
+    """Test ResolverFailedError when sync resolver raises an error."""
+    original_error = ValueError('Sync resolver error')
+    resolver = make_resolver('sync', {}, error=original_error)
+    with pytest.raises(ResolverFailedError) as excinfo:
+        await resolve('obj', 'test', resolver)
+    assert str(excinfo.value) == 'test resolver failed for obj; Sync resolver error'
+    assert excinfo.value.__cause__ is original_error
+
+
+async def test_resolve_async_resolver_raises_error() -> None:
+    """Test ResolverFailedError when async resolver raises an error."""
+    original_error = KeyError('Async resolver error')
+    resolver = make_resolver('async', {}, error=original_error)
+    with pytest.raises(ResolverFailedError) as excinfo:
+        await resolve('obj', 'test', resolver)
+    assert str(excinfo.value) == "test resolver failed for obj; 'Async resolver error'"
+    assert excinfo.value.__cause__ is original_error
+
+
+async def test_resolve_caches_resolver_kind() -> None:
+    """Test that the async check is cached per resolver."""
+
+    async def async_resolver(name: str) -> str:
+        return name
+
+    def sync_resolver(name: str) -> str:
+        return name
+
+    assert await resolve('obj1', 'test', async_resolver) == 'obj1'
+    assert await resolve('obj2', 'test', sync_resolver) == 'obj2'
+    assert _ASYNC_RESOLVERS[async_resolver] is True
+    assert _ASYNC_RESOLVERS[sync_resolver] is False
+
+
+async def test_resolve_cache_invokes_resolver_once() -> None:
+    """Test that cached resolutions invoke the resolver only once."""
+    calls: list[str] = []
+
+    def resolver(name: str) -> str:
+        calls.append(name)
+        return f'value_{name}'
+
+    assert await resolve('obj', 'test', resolver, cache=True) == 'value_obj'
+    assert await resolve('obj', 'test', resolver, cache=True) == 'value_obj'
+    assert calls == ['obj']
+
+    await resolve('obj', 'test', resolver)
+    assert calls == ['obj', 'obj']
+
+    clear_resolver_cache()
+    await resolve('obj', 'test', resolver, cache=True)
+    assert calls == ['obj', 'obj', 'obj']
+
+
+async def test_resolve_cache_skips_failures() -> None:
+    """Test that failed resolutions are not cached."""
+    data: dict[str, Any] = {}
+    resolver = make_resolver('sync', data)
+    with pytest.raises(LookupError):
+        await resolve('not_found', 'test', resolver, cache=True)
+    data['not_found'] = 'found'
+    assert await resolve('not_found', 'test', resolver, cache=True) == 'found'
+
+
+async def test_resolve_static_map_resolver() -> None:
+    """Test resolution with a StaticMapResolver."""
+    resolver = StaticMapResolver({'obj': 'value'})
+    assert await resolve('obj', 'test', resolver) == 'value'
+    with pytest.raises(LookupError) as excinfo:
+        await resolve('missing', 'test', resolver)
+    assert str(excinfo.value) == "test resolver for 'missing' returned None"
+
+
+async def test_resolve_cache_static_map_resolver() -> None:
+    """Test that results from a StaticMapResolver are cached."""
+    resolver = StaticMapResolver({'obj': 'value'})
+    assert await resolve('obj', 'test', resolver, cache=True) == 'value'
+    assert resolver in _ASYNC_RESOLVERS
+
+    resolver._data['obj'] = 'changed'
+    assert await resolve('obj', 'test', resolver, cache=True) == 'value'
+    assert await resolve('obj', 'test', resolver) == 'changed'
+
+
+async def test_resolve_tool_success() -> None:
+    """Test successful tool resolution."""
+    resolver = make_resolver('async', {'my_tool': mock_tool_def})
+    result = await resolve_tool('my_tool', resolver)
+    assert result == mock_tool_def
+
+
+async def test_resolve_tool_resolver_none() -> None:
+    """Test ValueError when the tool resolver is None."""
+    with pytest.raises(ValueError) as excinfo:
+        await resolve_tool('my_tool', None)
+    assert str(excinfo.value) == 'tool resolver is not defined'
 
 
-class TestResolveTool(unittest.IsolatedAsyncioTestCase):
-    """Tests for tool resolver functions."""
+async def test_resolve_tool_fails() -> None:
+    """Test failing tool resolution propagates error."""
+    resolver = make_resolver('async', {}, error=ValueError('Tool fail'))
+    with pytest.raises(ResolverFailedError) as excinfo:
+        await resolve_tool('bad_tool', resolver)
+    assert str(excinfo.value) == 'tool resolver failed for bad_tool; Tool fail'
 
-    async def test_resolve_tool_success(self) -> None:
-        """Test successful tool resolution."""
-        resolver = MockAsyncResolver({'my_tool': mock_tool_def})
-        result = await resolve_tool('my_tool', resolver)
-        self.assertEqual(result, mock_tool_def)
 
-    async def test_resolve_tool_fails(self) -> None:
-        """Test failing tool resolution propagates error."""
-        resolver = MockAsyncResolver({}, error=ValueError('Tool fail'))
-        with self.assertRaisesRegex(ResolverFailedError, r'tool resolver failed for bad_tool; Tool fail'):
-            await resolve_tool('bad_tool', resolver)
+async def test_resolve_partial_success() -> None:
+    """Test successful partial resolution."""
+    resolver = make_resolver('sync', {'my_partial': mock_partial_content})
+    result = await resolve_partial('my_partial', resolver)
+    assert result == mock_partial_content
 
 
-class TestResolvePartial(unittest.IsolatedAsyncioTestCase):
-    """Tests for partial resolver functions."""
+async def test_resolve_partial_resolver_none() -> None:
+    """Test ValueError when the partial resolver is None."""
+    with pytest.raises(ValueError) as excinfo:
+        await resolve_partial('my_partial', None)
+    assert str(excinfo.value) == 'partial resolver is not defined'
 
-    async def test_resolve_partial_success(self) -> None:
-        """Test successful partial resolution."""
-        resolver = MockSyncResolver({'my_partial': mock_partial_content})
-        result = await resolve_partial('my_partial', resolver)
-        self.assertEqual(result, mock_partial_content)
 
-    async def test_resolve_partial_fails(self) -> None:
-        """Test failing partial resolution propagates error."""
-        with self.assertRaisesRegex(LookupError, "partial resolver for 'missing_partial' returned None"):
-            await resolve_partial('missing_partial', MockSyncResolver({}))
+async def test_resolve_partial_fails() -> None:
+    """Test failing partial resolution propagates error."""
+    with pytest.raises(LookupError) as excinfo:
+        await resolve_partial('missing_partial', make_resolver('sync', {}))
+    assert str(excinfo.value) == "partial resolver for 'missing_partial' returned None"
 
 
-class TestResolveJsonSchema(unittest.IsolatedAsyncioTestCase):
-    """Tests for JSON schema resolver function."""
+async def test_resolve_json_schema_success_sync() -> None:
+    """Test successful schema resolution with sync resolver."""
+    resolver = make_resolver('sync', {'MySchema': mock_json_schema})
+    result = await resolve_json_schema('MySchema', resolver)
+    assert result == mock_json_schema
 
-    async def test_resolve_json_schema_success_sync(self) -> None:
-        """Test successful schema resolution with sync resolver."""
-        resolver = MockSyncResolver({'MySchema': mock_json_schema})
-        result = await resolve_json_schema('MySchema', resolver)
-        self.assertEqual(result, mock_json_schema)
 
-    async def test_resolve_json_schema_success_async(self) -> None:
-        """Test successful schema resolution with async resolver."""
-        resolver = MockAsyncResolver({'MySchema': mock_json_schema})
-        result = await resolve_json_schema('MySchema', resolver)
-        self.assertEqual(result, mock_json_schema)
+async def test_resolve_json_schema_success_async() -> None:
+    """Test successful schema resolution with async resolver."""
+    resolver = make_resolver('async', {'MySchema': mock_json_schema})
+    result = await resolve_json_schema('MySchema', resolver)
+    assert result == mock_json_schema
 
-    async def test_resolve_json_schema_fails_error(self) -> None:
-        """Test failing schema resolution propagates error."""
-        resolver = MockSyncResolver({}, error=TypeError('Schema Error'))
-        with self.assertRaisesRegex(ResolverFailedError, r'schema resolver failed for bad_schema; Schema Error'):
-            await resolve_json_schema('bad_schema', resolver)
 
-    async def test_resolve_json_schema_fails_none(self) -> None:
-        """Test failing schema resolution propagates error when None is returned."""
-        resolver = MockAsyncResolver({})
-        with self.assertRaisesRegex(LookupError, r"schema resolver for 'missing_schema' returned None"):
-            await resolve_json_schema('missing_schema', resolver)
+async def test_resolve_json_schema_fails_error() -> None:
+    """Test failing schema resolution propagates error."""
+    resolver = make_resolver('sync', {}, error=TypeError('Schema Error'))
+    with pytest.raises(ResolverFailedError) as excinfo:
+        await resolve_json_schema('bad_schema', resolver)
+    assert str(excinfo.value) == 'schema resolver failed for bad_schema; Schema Error'
 
 
-if __name__ == '__main__':
-    unittest.main()
+async def test_resolve_json_schema_fails_none() -> None:
+    """Test failing schema resolution propagates error when None is returned."""
+    resolver = make_resolver('async', {})
+    with pytest.raises(LookupError) as excinfo:
+        await resolve_json_schema('missing_schema', resolver)
+    assert str(excinfo.value) == "schema resolver for 'missing_schema' returned None"
@@ -99,13 +99,15 @@ spec/
 
 from __future__ import annotations
 
-import asyncio
+import functools
+import os
 import re
-import unittest
-from collections.abc import Callable, Coroutine
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Generic, TypedDict
+from typing import Any, Final, Generic
 
+import pytest
 import structlog
 import yaml
 from pydantic import BaseModel, Field
@@ -122,6 +124,12 @@ from dotpromptz.typing import (
     ToolDefinition,
 )
 
+try:
+    # Use the libyaml bindings when available; they are several times faster.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = structlog.get_logger(__name__)
 
 
@@ -145,9 +153,17 @@ ALLOWLISTED_FILES = [
     # 'spec/metadata.yaml',
 ]
 
-# Counters for test class and test method names.
-suite_counter = 0
-test_case_counter = 0
+# Absolute paths of the allowlisted spec files.
+ALLOWED_PATHS = [ROOT_DIR / p for p in ALLOWLISTED_FILES]
+
+# Regular expression matching characters that are not valid in a Python identifier.
+NON_IDENTIFIER_REGEX = re.compile(r'[^a-zA-Z0-9_]')
+
+# Translation table replacing the same characters within the ASCII range.
+_ASCII_IDENTIFIER_TABLE = {c: '_' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')}
+
+# Shared stand-in for suites and tests without data. It is never mutated.
+_EMPTY_DATA: Final = DataArgument[Any]()
 
 
 class Expect(BaseModel):
@@ -184,68 +200,79 @@ class SpecSuite(BaseModel, Generic[ModelConfigT]):
     tests: list[SpecTest[ModelConfigT]] = Field(default_factory=list)
 
 
-def is_allowed_spec_file(file: Path) -> bool:
-    """Check if a spec file is allowed.
+def _iter_spec_files(root: Path) -> Iterator[Path]:
+    """Yields the YAML spec files under a directory, recursively.
+
+    Uses `os.scandir`, whose entries already know their type, so that no
+    extra `stat` calls are made while walking.
 
     Args:
-        file: The file to check.
+        root: The directory to search.
 
-    Returns:
-        True if the file is allowed, False otherwise.
+    Yields:
+        The paths of the `.yaml` files found.
     """
-    fname = file.absolute().as_posix()
-    for allowed_file in ALLOWLISTED_FILES:
-        if fname.endswith(allowed_file):
-            return True
-    return False
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _iter_spec_files(Path(entry.path))
+            elif entry.name.endswith('.yaml'):
+                yield Path(entry.path)
 
 
-def sanitize_name_component(name: str | None) -> str:
-    """Sanitizes a name component for use in a Python identifier.
+# All YAML spec files, found once at import.
+YAML_FILES = tuple(sorted(_iter_spec_files(SPECS_DIR)))
+
+
+@functools.cache
+def _load_yaml(path: Path) -> tuple[Any, ...]:
+    """Loads and parses a YAML spec file, at most once per path.
 
     Args:
-        name: The name to sanitize.
+        path: The path to the YAML file.
 
     Returns:
-        A sanitized name.
+        The parsed YAML documents, in file order.
     """
-    name_str = str(name) if name is not None else 'None'
-    name_str = re.sub(r'[^a-zA-Z0-9_]', '_', name_str)
-    if name_str and name_str[0].isdigit():
-        name_str = '_' + name_str
-    return name_str or 'unnamed_component'
+    # Hand the raw bytes to the loader so libyaml decodes and scans one
+    # contiguous buffer instead of a Python string.
+    return tuple(yaml.load_all(path.read_bytes(), Loader=SafeLoader))
 
 
-def make_test_method_name(yaml_file_name: str, suite_name: str | None, test_desc: str | None) -> str:
-    """Creates a sanitized test method name.
+@functools.cache
+def _load_suites(path: Path) -> list[SpecSuite[Any]]:
+    """Loads and validates the suites of a YAML spec file, at most once per path.
 
     Args:
-        yaml_file_name: The name of the YAML file.
-        suite_name: The name of the suite.
-        test_desc: The description of the test.
+        path: The path to the YAML file.
 
     Returns:
-        A sanitized test method name.
+        The suites defined in the file's documents, each with a name.
     """
-    file_part = sanitize_name_component(yaml_file_name.replace('.yaml', ''))
-    suite_part = sanitize_name_component(suite_name)
-    desc_part = sanitize_name_component(test_desc)
-    return f'test_{file_part}_{suite_part}_{desc_part}_'
+    suites = [SpecSuite(**suite_data) for document in _load_yaml(path) for suite_data in document or []]
+    for suite in suites:
+        # Normalize the suite data to ensure it has a name.
+        suite.name = suite.name or f'UnnamedSuite_{path.stem}'
+    return suites
 
 
-def make_test_class_name(yaml_file_name: str, suite_name: str | None) -> str:
-    """Creates a sanitized test class name for a suite.
+@functools.lru_cache(maxsize=4096)
+def sanitize_name_component(name: str | None) -> str:
+    """Sanitizes a name component for use in a Python identifier.
 
     Args:
-        yaml_file_name: The name of the YAML file.
-        suite_name: The name of the suite.
+        name: The name to sanitize.
 
     Returns:
-        A sanitized test class name.
+        A sanitized name.
     """
-    file_part = sanitize_name_component(yaml_file_name.replace('.yaml', ''))
-    suite_part = sanitize_name_component(suite_name)
-    return f'Test_{file_part}_{suite_part}Suite'
+    name_str = str(name) if name is not None else 'None'
+    name_str = name_str.translate(_ASCII_IDENTIFIER_TABLE)
+    if not name_str.isascii():
+        name_str = NON_IDENTIFIER_REGEX.sub('_', name_str)
+    if name_str and name_str[0].isdigit():
+        name_str = '_' + name_str
+    return name_str or 'unnamed_component'
 
 
 def make_dotprompt_for_suite(suite: SpecSuite[ModelConfigT]) -> Dotprompt:
@@ -276,198 +303,179 @@ def make_dotprompt_for_suite(suite: SpecSuite[ModelConfigT]) -> Dotprompt:
     return dotprompt
 
 
-class TestSpecFiles(unittest.IsolatedAsyncioTestCase):
-    """Runs essential checks to ensure the spec directory is valid."""
-
-    def test_spec_path(self) -> None:
-        """Test that the spec directory exists."""
-        self.assertTrue(SPECS_DIR.exists())
-        self.assertTrue(SPECS_DIR.is_dir())
-
-    def test_spec_path_contains_yaml_files(self) -> None:
-        """Test that the spec directory contains YAML files."""
-        self.assertTrue(list(SPECS_DIR.glob('**/*.yaml')))
-
-    def test_spec_files_are_valid(self) -> None:
-        """Test that all spec files contain valid YAML."""
-        for file in SPECS_DIR.glob('**/*.yaml'):
-            with open(file) as f:
-                data = yaml.safe_load(f)
-                self.assertIsNotNone(data)
-
-
-class YamlSpecTestBase(unittest.IsolatedAsyncioTestCase, Generic[ModelConfigT]):
-    """A base class that is used as a template for all YAML spec test suites."""
-
-    async def run_yaml_test(
-        self, yaml_file: Path, suite: SpecSuite[ModelConfigT], test_case: SpecTest[ModelConfigT]
-    ) -> None:
-        """Runs a YAML test.
+def test_spec_path() -> None:
+    """Test that the spec directory exists."""
+    assert SPECS_DIR.exists()
+    assert SPECS_DIR.is_dir()
 
-        Args:
-            yaml_file: The path to the YAML file.
-            suite: The suite to run the test on.
-            test_case: The test case to run.
 
-        Returns:
-            None.
-        """
-        logger.info(f'[TEST] {yaml_file.stem} > {suite.name} > {test_case.desc}')
+def test_spec_path_contains_yaml_files() -> None:
+    """Test that the spec directory contains YAML files."""
+    assert YAML_FILES
 
-        # Create test-specific dotprompt instance.
-        dotprompt = make_dotprompt_for_suite(suite)
-        self.assertIsNotNone(dotprompt)
 
-        data = self._merge_data(suite.data or DataArgument[Any](), test_case.data or DataArgument[Any]())
-        result = await dotprompt.render(suite.template, data, test_case.options)
-        pruned_res: Expect = Expect(**result.model_dump())
+@pytest.mark.parametrize('file', YAML_FILES, ids=lambda file: str(file.relative_to(SPECS_DIR)))
+def test_spec_files_are_valid(file: Path) -> None:
+    """Test that a spec file contains valid YAML."""
+    # The parse is shared with case collection through the `_load_yaml` cache.
+    documents = _load_yaml(file)
+    assert documents
+    assert None not in documents
 
-        # Only compare raw if the spec demands it.
-        if test_case.expect.raw is None:
-            pruned_res.raw = None
 
-        self.assertEqual(pruned_res, test_case.expect)
-
-    def _merge_data(self, data1: DataArgument[Any], data2: DataArgument[Any]) -> DataArgument[Any]:
-        merged = DataArgument[Any]()
-        merged.input = data1.input or data2.input
-        merged.docs = (data1.docs or []) + (data2.docs or [])
-        merged.messages = (data1.messages or []) + (data2.messages or [])
-        merged.context = {**(data1.context or {}), **(data2.context or {})}
-        return merged
-
-
-def make_suite_class_name(yaml_file: Path, suite_name: str | None) -> str:
-    """Creates a class name for a suite.
+async def run_yaml_test(
+    yaml_file: Path, suite: SpecSuite[ModelConfigT], test_case: SpecTest[ModelConfigT], dotprompt: Dotprompt
+) -> None:
+    """Runs a YAML test.
 
     Args:
         yaml_file: The path to the YAML file.
-        suite_name: The name of the suite.
+        suite: The suite to run the test on.
+        test_case: The test case to run.
+        dotprompt: The Dotprompt instance shared by the tests of the suite.
 
     Returns:
-        A class name for the suite.
+        None.
     """
-    global suite_counter
-    suite_counter += 1
-    file_part = sanitize_name_component(yaml_file.stem)
-    suite_part = sanitize_name_component(suite_name)
-    return f'Test_{file_part}_{suite_part}Suite_{suite_counter}'
+    # Log names only; the suite and test models carry whole templates and data.
+    logger.debug('Running spec test', file=yaml_file.stem, suite=suite.name, test=test_case.desc)
 
+    data = _merge_data(
+        suite.data if suite.data is not None else _EMPTY_DATA,
+        test_case.data if test_case.data is not None else _EMPTY_DATA,
+    )
+    result = await dotprompt.render(suite.template, data, test_case.options)
+    # The rendered fields are already validated, so build the expectation
+    # without dumping and re-validating them.
+    pruned_res = Expect.model_construct(
+        **{name: value for name in Expect.model_fields if (value := getattr(result, name, None)) is not None}
+    )
 
-def make_test_case_name(yaml_file: Path, suite_name: str, test_desc: str) -> str:
-    """Creates a test case name.
+    # Only compare raw if the spec demands it.
+    if test_case.expect.raw is None:
+        pruned_res.raw = None
+
+    assert pruned_res == test_case.expect
+
+
+def _merge_data(data1: DataArgument[Any], data2: DataArgument[Any]) -> DataArgument[Any]:
+    """Merges suite-level data with test-level data.
 
     Args:
-        yaml_file: The path to the YAML file.
-        suite_name: The name of the suite.
-        test_desc: The description of the test.
+        data1: The suite-level data.
+        data2: The test-level data, whose context entries take precedence.
 
     Returns:
-        A test case name.
+        The merged data, which is one of the arguments if the other is empty.
     """
-    global test_case_counter
-    test_case_counter += 1
-    file_part = sanitize_name_component(yaml_file.stem)
-    suite_part = sanitize_name_component(suite_name)
-    test_method_part = sanitize_name_component(test_desc)
-    return f'test_{file_part}_{suite_part}_{test_method_part}_{test_case_counter}'
+    if data2 is _EMPTY_DATA:
+        return data1
+    if data1 is _EMPTY_DATA:
+        return data2
+    merged = DataArgument[Any]()
+    merged.input = data1.input or data2.input
+    merged.docs = [*(data1.docs or ()), *(data2.docs or ())]
+    merged.messages = [*(data1.messages or ()), *(data2.messages or ())]
+    merged.context = {**(data1.context or {}), **(data2.context or {})}
+    return merged
 
 
-def make_async_test_case_method(
-    yaml_file: Path,
-    suite: SpecSuite[ModelConfigT],
-    test_case: SpecTest[ModelConfigT],
-) -> Callable[[YamlSpecTestBase[ModelConfigT]], Coroutine[Any, Any, None]]:
-    """Creates an async test method for a test case.
+def _preload_yaml(files: list[Path]) -> None:
+    """Parses YAML spec files concurrently into the `_load_yaml` cache.
 
-    Args:
-        yaml_file: The path to the YAML file.
-        suite: The suite to create the test method for.
-        test_case: The test case to create the test method for.
+    Files that fail to parse are left uncached, so that loading them again
+    reports the error where it is handled.
 
-    Returns:
-        An async test method.
+    Args:
+        files: The YAML spec files to parse.
     """
 
-    async def test_method(self_dynamic: YamlSpecTestBase[ModelConfigT]) -> None:
-        """An async test method."""
-        await self_dynamic.run_yaml_test(yaml_file, suite, test_case)
+    def load(file: Path) -> None:
+        try:
+            _load_yaml(file)
+        except yaml.YAMLError:
+            pass
 
-    return test_method
+    if files:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            list(executor.map(load, files))
 
 
-def make_async_skip_test_method(
-    yaml_file: Path, suite_name: str
-) -> Callable[[YamlSpecTestBase[ModelConfigT]], Coroutine[Any, Any, None]]:
-    """Creates a skip test for a suite.
+def make_test_case_id(yaml_file: Path, suite_name: str, test_desc: str) -> str:
+    """Creates a pytest ID for a test case.
 
     Args:
         yaml_file: The path to the YAML file.
         suite_name: The name of the suite.
+        test_desc: The description of the test.
 
     Returns:
-        A skip test.
+        A test case ID.
     """
+    file_part = sanitize_name_component(yaml_file.stem)
+    suite_part = sanitize_name_component(suite_name)
+    test_method_part = sanitize_name_component(test_desc)
+    return f'{file_part}-{suite_part}-{test_method_part}'
 
-    async def skip_method(self_dynamic: YamlSpecTestBase[ModelConfigT]) -> None:
-        self_dynamic.skipTest(f"Suite '{suite_name}' in {yaml_file.stem} has no tests.")
-
-    return skip_method
 
+def _collect_all_cases(files: list[Path]) -> list[Any]:
+    """Collects the test cases of YAML spec files as pytest parameters.
 
-def generate_test_suites(files: list[Path]) -> None:
-    """Dynamically generates test suite classes and methods from YAML spec files.
+    Each suite gets a single Dotprompt instance shared by its test cases, and
+    suites without tests are collected as a skipped case.
 
     Args:
-        files: A list of YAML spec files to generate test suites from.
+        files: A list of YAML spec files to collect test cases from.
 
     Returns:
-        None.
+        A list of `pytest.param` sets of the YAML file, suite, test case and
+        Dotprompt instance.
     """
-    module_globals = globals()
+    _preload_yaml([file for file in files if file.exists()])
 
+    cases: list[Any] = []
     for yaml_file in files:
-        if not is_allowed_spec_file(yaml_file):
-            logger.warn('Skipping non-allowlisted spec file for class generation', file=str(yaml_file))
+        if not yaml_file.exists():
+            logger.warn('Skipping missing allowlisted spec file', file=str(yaml_file))
             continue
 
         # Load the YAML file and ensure it's valid.
         try:
-            with open(yaml_file, encoding='utf-8') as f:
-                suites_data = yaml.safe_load(f)
-            if not suites_data:
+            suites = _load_suites(yaml_file)
+            if not suites:
                 logger.warn('Skipping spec file with no data', file=str(yaml_file))
                 continue
         except yaml.YAMLError as e:
             logger.error('Error loading spec file', file=str(yaml_file), error=e)
             raise
 
-        # Iterate over the suites in the YAML file and ensure it has a name.
-        for suite_data in suites_data:
-            # Normalize the suite data to ensure it has a name.
-            suite = SpecSuite(**suite_data)
-            suite.name = suite.name or f'UnnamedSuite_{yaml_file.stem}'
-
-            # Create the dynamic test class for the suite.
-            class_name = make_suite_class_name(yaml_file, suite.name)
-            klass = type(class_name, (YamlSpecTestBase,), {})
-
+        for suite in suites:
             # Skip the suite if it has no tests.
             if not suite.tests:
-                klass.test_empty_suite = make_async_skip_test_method(yaml_file, suite.name)  # type: ignore[attr-defined]
+                cases.append(
+                    pytest.param(
+                        yaml_file,
+                        suite,
+                        None,
+                        None,
+                        id=make_test_case_id(yaml_file, suite.name, 'empty_suite'),
+                        marks=pytest.mark.skip(reason=f"Suite '{suite.name}' in {yaml_file.stem} has no tests."),
+                    )
+                )
+                continue
 
-            # Iterate over the tests in the suite and add them to the class.
+            # The suite is immutable, so build its Dotprompt instance once and
+            # share it between the suite's tests.
+            dotprompt = make_dotprompt_for_suite(suite)
             for tc in suite.tests:
-                # Create the test case method and add it to the class.
-                test_case_name = make_test_case_name(yaml_file, suite.name, tc.desc)
-                test_method = make_async_test_case_method(yaml_file, suite, tc)
-                setattr(klass, test_case_name, test_method)
-
-            # Add the test suite class to the module globals.
-            module_globals[class_name] = klass
-
+                cases.append(
+                    pytest.param(yaml_file, suite, tc, dotprompt, id=make_test_case_id(yaml_file, suite.name, tc.desc))
+                )
+    return cases
 
-generate_test_suites(list(SPECS_DIR.glob('**/*.yaml')))
 
-if __name__ == '__main__':
-    unittest.main()
+@pytest.mark.asyncio(loop_scope='session')
+@pytest.mark.parametrize(('yaml_file', 'suite', 'test_case', 'dotprompt'), _collect_all_cases(ALLOWED_PATHS))
+async def test_spec(yaml_file: Path, suite: SpecSuite[Any], test_case: SpecTest[Any], dotprompt: Dotprompt) -> None:
+    """Runs a single test case of a YAML spec suite."""
+    await run_yaml_test(yaml_file, suite, test_case, dotprompt)
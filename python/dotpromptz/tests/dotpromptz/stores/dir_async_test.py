@@ -41,10 +41,10 @@ from __future__ import annotations
 import asyncio
 import os
 import shutil
+import uuid
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
-import aiofiles
 import pytest
 import pytest_asyncio
 
@@ -57,21 +57,52 @@ from dotpromptz.typing import (
     PromptData,
 )
 
+# Versions of the sources used by the tests, hashed once at import.
+_VERSIONS = {
+    source: calculate_version(source)
+    for source in (
+        'test source 1',
+        'test source 2',
+        'test variant source',
+        'test subdir source',
+        'partial source 1',
+        'partial source 2',
+        'test partial variant source',
+        'test subdir partial source',
+        'test source content',
+        'partial source content',
+        'new source content',
+        'new variant source',
+        'new subdir source',
+        'new partial content',
+    )
+}
+
 
 async def _create_test_file_async(directory: Path, name: str, content: str = 'test source') -> Path:
-    """Asynchronously create a test file."""
+    """Create a test file for an async test."""
     file_path = directory / name
     os.makedirs(file_path.parent, exist_ok=True)
-    async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-        await f.write(content)
+    # Fixture files are tiny, so write them directly rather than paying for a
+    # thread pool round trip through aiofiles on every file.
+    file_path.write_text(content, encoding='utf-8')
     return file_path
 
 
+@pytest.fixture(scope='session')
+def _session_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Pytest fixture to provide a temporary directory shared by all tests."""
+    return tmp_path_factory.mktemp('stores')
+
+
 @pytest.fixture
-def temp_dir(tmp_path: Path) -> Path:
+def temp_dir(_session_tmp: Path) -> Path:
     """Pytest fixture to provide a temporary directory for tests."""
-    # tmp_path is automatically created and cleaned up by pytest
-    return tmp_path
+    # Each test gets its own subdirectory of the shared directory, which pytest
+    # cleans up with the rest of its temporary files.
+    directory = _session_tmp / uuid.uuid4().hex
+    directory.mkdir()
+    return directory
 
 
 @pytest_asyncio.fixture
@@ -103,19 +134,19 @@ async def test_list_prompts(async_store: DirStore, temp_dir: Path) -> None:
 
     assert prompts[0].name == 'other'
     assert prompts[0].variant is None
-    assert prompts[0].version == calculate_version(content2)
+    assert prompts[0].version == _VERSIONS[content2]
 
     assert prompts[1].name == 'subdir/sub'
     assert prompts[1].variant is None
-    assert prompts[1].version == calculate_version(content_subdir)
+    assert prompts[1].version == _VERSIONS[content_subdir]
 
     assert prompts[2].name == 'test'
     assert prompts[2].variant is None
-    assert prompts[2].version == calculate_version(content1)
+    assert prompts[2].version == _VERSIONS[content1]
 
     assert prompts[3].name == 'test'
     assert prompts[3].variant == 'v1'
-    assert prompts[3].version == calculate_version(content_variant)
+    assert prompts[3].version == _VERSIONS[content_variant]
 
 
 @pytest.mark.asyncio
@@ -141,26 +172,26 @@ async def test_list_partials(async_store: DirStore, temp_dir: Path) -> None:
 
     assert partials[0].name == 'other'
     assert partials[0].variant is None
-    assert partials[0].version == calculate_version(content2)
+    assert partials[0].version == _VERSIONS[content2]
 
     assert partials[1].name == 'partial'
     assert partials[1].variant is None
-    assert partials[1].version == calculate_version(content1)
+    assert partials[1].version == _VERSIONS[content1]
 
     assert partials[2].name == 'subdir/sub'
     assert partials[2].variant is None
-    assert partials[2].version == calculate_version(content_subdir)
+    assert partials[2].version == _VERSIONS[content_subdir]
 
     assert partials[3].name == 'test'
     assert partials[3].variant == 'v1'
-    assert partials[3].version == calculate_version(content_variant)
+    assert partials[3].version == _VERSIONS[content_variant]
 
 
 @pytest.mark.asyncio
 async def test_load_prompt(async_store: DirStore, temp_dir: Path) -> None:
     """Test loading prompts asynchronously."""
     source = 'test source content'
-    version = calculate_version(source)
+    version = _VERSIONS[source]
     await _create_test_file_async(temp_dir, 'test.prompt', source)
     await _create_test_file_async(temp_dir, 'subdir/nested.prompt', source)
     await _create_test_file_async(temp_dir, 'variant.v1.prompt', source)
@@ -202,7 +233,7 @@ async def test_load_prompt(async_store: DirStore, temp_dir: Path) -> None:
 async def test_load_partial(async_store: DirStore, temp_dir: Path) -> None:
     """Test loading partials asynchronously."""
     source = 'partial source content'
-    version = calculate_version(source)
+    version = _VERSIONS[source]
     await _create_test_file_async(temp_dir, '_test.prompt', source)
     nested_path = str(Path('subdir') / '_nested.prompt')
     await _create_test_file_async(temp_dir, nested_path, source)
@@ -245,16 +276,14 @@ async def test_load_partial(async_store: DirStore, temp_dir: Path) -> None:
 async def test_save_prompt(async_store: DirStore, temp_dir: Path) -> None:
     """Test saving prompts asynchronously."""
     source = 'new source content'
-    version = calculate_version(source)
+    version = _VERSIONS[source]
     prompt = PromptData(name='new_prompt', source=source, version=version)
 
     await async_store.save(prompt)
 
     file_path = temp_dir / 'new_prompt.prompt'
-    assert file_path.exists()
-    async with aiofiles.open(file_path, encoding='utf-8') as f:
-        saved_content = await f.read()
-    assert saved_content == source
+    assert os.path.exists(file_path)
+    assert file_path.read_text(encoding='utf-8') == source
 
     # Verify version after loading
     loaded = await async_store.load('new_prompt')
@@ -265,16 +294,14 @@ async def test_save_prompt(async_store: DirStore, temp_dir: Path) -> None:
 async def test_save_prompt_variant(async_store: DirStore, temp_dir: Path) -> None:
     """Test saving prompt variants asynchronously."""
     source = 'new variant source'
-    version = calculate_version(source)
+    version = _VERSIONS[source]
     prompt = PromptData(name='new_prompt', variant='beta', source=source, version=version)
 
     await async_store.save(prompt)
 
     file_path = temp_dir / 'new_prompt.beta.prompt'
-    assert file_path.exists()
-    async with aiofiles.open(file_path, encoding='utf-8') as f:
-        saved_content = await f.read()
-    assert saved_content == source
+    assert os.path.exists(file_path)
+    assert file_path.read_text(encoding='utf-8') == source
 
     loaded = await async_store.load('new_prompt', LoadPromptOptions(variant='beta'))
     assert loaded.version == version
@@ -284,16 +311,14 @@ async def test_save_prompt_variant(async_store: DirStore, temp_dir: Path) -> Non
 async def test_save_prompt_subdir(async_store: DirStore, temp_dir: Path) -> None:
     """Test saving prompts in subdirectories asynchronously."""
     source = 'new subdir source'
-    version = calculate_version(source)
+    version = _VERSIONS[source]
     prompt = PromptData(name='subdir/new_prompt', source=source, version=version)
 
     await async_store.save(prompt)
 
     file_path = temp_dir / 'subdir' / 'new_prompt.prompt'
-    assert file_path.exists()
-    async with aiofiles.open(file_path, encoding='utf-8') as f:
-        saved_content = await f.read()
-    assert saved_content == source
+    assert os.path.exists(file_path)
+    assert file_path.read_text(encoding='utf-8') == source
 
     loaded = await async_store.load('subdir/new_prompt')
     assert loaded.version == version
@@ -304,16 +329,14 @@ async def test_save_partial(async_store: DirStore, temp_dir: Path) -> None:
     """Test saving partials asynchronously."""
     # Note: `save` uses the name directly, including '_'.
     source = 'new partial content'
-    version = calculate_version(source)
+    version = _VERSIONS[source]
     partial = PromptData(name='_new_partial', source=source, version=version)
 
     await async_store.save(partial)
 
     file_path = temp_dir / '_new_partial.prompt'
-    assert file_path.exists()
-    async with aiofiles.open(file_path, encoding='utf-8') as f:
-        saved_content = await f.read()
-    assert saved_content == source
+    assert os.path.exists(file_path)
+    assert file_path.read_text(encoding='utf-8') == source
 
     # Use load_partial (without '_') to verify
     loaded = await async_store.load_partial('new_partial')
@@ -329,15 +352,15 @@ async def test_delete_prompt(async_store: DirStore, temp_dir: Path) -> None:
 
     # Delete basic prompt
     await async_store.delete('test_delete')
-    assert not (temp_dir / 'test_delete.prompt').exists()
+    assert not os.path.exists(temp_dir / 'test_delete.prompt')
 
     # Delete nested prompt
     await async_store.delete('subdir/nested_delete')
-    assert not (temp_dir / 'subdir' / 'nested_delete.prompt').exists()
+    assert not os.path.exists(temp_dir / 'subdir' / 'nested_delete.prompt')
 
     # Delete variant
     await async_store.delete('variant_delete', DeletePromptOrPartialOptions(variant='v1'))
-    assert not (temp_dir / 'variant_delete.v1.prompt').exists()
+    assert not os.path.exists(temp_dir / 'variant_delete.v1.prompt')
 
     # Delete non-existent
     with pytest.raises(FileNotFoundError):
@@ -352,11 +375,11 @@ async def test_delete_partial(async_store: DirStore, temp_dir: Path) -> None:
 
     # Delete basic partial (using name without '_')
     await async_store.delete('test_delete_partial')
-    assert not (temp_dir / '_test_delete_partial.prompt').exists()
+    assert not os.path.exists(temp_dir / '_test_delete_partial.prompt')
 
     # Delete variant partial (using name without '_')
     await async_store.delete('variant_delete_partial', DeletePromptOrPartialOptions(variant='v1'))
-    assert not (temp_dir / '_variant_delete_partial.v1.prompt').exists()
+    assert not os.path.exists(temp_dir / '_variant_delete_partial.v1.prompt')
 
 
 @pytest.mark.asyncio
@@ -367,5 +390,5 @@ async def test_delete_prioritizes_prompt_over_partial(async_store: DirStore, tem
 
     await async_store.delete('conflict')
 
-    assert not (temp_dir / 'conflict.prompt').exists()  # Prompt should be gone
-    assert (temp_dir / '_conflict.prompt').exists()  # Partial should remain
+    assert not os.path.exists(temp_dir / 'conflict.prompt')  # Prompt should be gone
+    assert os.path.exists(temp_dir / '_conflict.prompt')  # Partial should remain
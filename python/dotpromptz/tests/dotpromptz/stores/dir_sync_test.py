@@ -58,6 +58,15 @@ from dotpromptz.typing import (
 )
 
 
+# Prompt files created by the `populated_store` fixture, with their sources.
+PROMPT_SOURCES = {
+    'test.prompt': 'test source 1',
+    'other.prompt': 'test source 2',
+    'test.v1.prompt': 'test variant source',
+    'subdir/sub.prompt': 'test subdir source',
+}
+
+
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
     """Pytest fixture to provide a temporary directory for sync tests."""
@@ -71,41 +80,36 @@ def sync_store(temp_dir: Path) -> DirStoreSync:
     return DirStoreSync(DirStoreOptions(directory=temp_dir))
 
 
-def test_list_prompts(sync_store: DirStoreSync, temp_dir: Path) -> None:
-    """Test listing prompts synchronously."""
-    content1 = 'test source 1'
-    content2 = 'test source 2'
-    content_variant = 'test variant source'
-    content_subdir = 'test subdir source'
-
-    create_test_prompt_sync(temp_dir, 'test.prompt', content1)
-    create_test_prompt_sync(temp_dir, 'other.prompt', content2)
-    create_test_prompt_sync(temp_dir, 'test.v1.prompt', content_variant)
-    nested_path = str(Path('subdir') / 'sub.prompt')
-    create_test_prompt_sync(temp_dir, nested_path, content_subdir)
-    # Create a partial, which should be ignored by list()
-    create_test_partial_sync(temp_dir, '_partial.prompt', 'partial')
+@pytest.fixture
+def populated_store(sync_store: DirStoreSync, temp_dir: Path) -> DirStoreSync:
+    """Fixture to provide a sync DirStore holding the test prompts and a partial."""
+    for file_name, source in PROMPT_SOURCES.items():
+        create_test_prompt_sync(temp_dir, file_name, source)
+    create_test_partial_sync(temp_dir, 'partial.prompt', 'partial')
+    return sync_store
 
-    result = sync_store.list()
-    assert len(result.prompts) == 4  # Should ignore the partial
 
-    prompts = sorted(result.prompts, key=lambda p: (p.name, p.variant or ''))
+def test_list_prompts(populated_store: DirStoreSync) -> None:
+    """Test listing prompts synchronously."""
+    result = populated_store.list()
 
-    assert prompts[0].name == 'other'
-    assert prompts[0].variant is None
-    assert prompts[0].version == calculate_version(content2)
+    # Sorted by name and variant; the partial is ignored.
+    prompts = sorted(result.prompts, key=lambda p: (p.name, p.variant or ''))
+    assert [(p.name, p.variant, p.version) for p in prompts] == [
+        ('other', None, calculate_version('test source 2')),
+        ('subdir/sub', None, calculate_version('test subdir source')),
+        ('test', None, calculate_version('test source 1')),
+        ('test', 'v1', calculate_version('test variant source')),
+    ]
 
-    assert prompts[1].name == 'subdir/sub'
-    assert prompts[1].variant is None
-    assert prompts[1].version == calculate_version(content_subdir)
 
-    assert prompts[2].name == 'test'
-    assert prompts[2].variant is None
-    assert prompts[2].version == calculate_version(content1)
+def test_list_prompts_skips_broken_symlinks(populated_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test that prompt names that do not resolve to regular files are skipped."""
+    os.symlink(temp_dir / 'missing.prompt', temp_dir / 'broken.prompt')
+    os.mkfifo(temp_dir / 'pipe.prompt')
 
-    assert prompts[3].name == 'test'
-    assert prompts[3].variant == 'v1'
-    assert prompts[3].version == calculate_version(content_variant)
+    names = sorted(p.name for p in populated_store.list().prompts)
+    assert names == ['other', 'subdir/sub', 'test', 'test']
 
 
 def test_list_partials(sync_store: DirStoreSync, temp_dir: Path) -> None:
@@ -145,46 +149,56 @@ def test_list_partials(sync_store: DirStoreSync, temp_dir: Path) -> None:
     assert partials[3].version == calculate_version(content_variant)
 
 
-def test_load_prompt(sync_store: DirStoreSync, temp_dir: Path) -> None:
+def test_list_prompts_sees_changed_files(sync_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test that listing again picks up the new version of a changed file."""
+    create_test_prompt_sync(temp_dir, 'test.prompt', 'test source')
+    assert sync_store.list().prompts[0].version == calculate_version('test source')
+
+    create_test_prompt_sync(temp_dir, 'test.prompt', 'changed test source')
+    assert sync_store.list().prompts[0].version == calculate_version('changed test source')
+
+
+@pytest.mark.parametrize(
+    ('name', 'variant', 'source'),
+    [
+        ('test', None, 'test source 1'),
+        ('subdir/sub', None, 'test subdir source'),
+        ('test', 'v1', 'test variant source'),
+    ],
+)
+def test_load_prompt(populated_store: DirStoreSync, name: str, variant: str | None, source: str) -> None:
     """Test loading prompts synchronously."""
-    source = 'test source content'
     version = calculate_version(source)
-    create_test_prompt_sync(temp_dir, 'test.prompt', source)
-    nested_path = str(Path('subdir') / 'nested.prompt')
-    create_test_prompt_sync(temp_dir, nested_path, source)
-    create_test_prompt_sync(temp_dir, 'variant.v1.prompt', source)
 
-    # Load basic prompt
-    result = sync_store.load('test')
-    assert result.name == 'test'
+    result = populated_store.load(name, LoadPromptOptions(variant=variant))
+    assert result.name == name
+    assert result.variant == variant
     assert result.source == source
     assert result.version == version
-    assert result.variant is None
-
-    # Load nested prompt
-    result_nested = sync_store.load('subdir/nested')
-    assert result_nested.name == 'subdir/nested'
-    assert result_nested.source == source
-    assert result_nested.version == version
-
-    # Load variant
-    result_variant = sync_store.load('variant', LoadPromptOptions(variant='v1'))
-    assert result_variant.name == 'variant'
-    assert result_variant.variant == 'v1'
-    assert result_variant.source == source
-    assert result_variant.version == version
 
     # Load with specific version
-    result_version = sync_store.load('test', LoadPromptOptions(version=version))
+    result_version = populated_store.load(name, LoadPromptOptions(variant=variant, version=version))
     assert result_version.version == version
 
+
+def test_load_prompt_errors(populated_store: DirStoreSync) -> None:
+    """Test loading missing prompts and mismatched versions synchronously."""
     # Load non-existent prompt
     with pytest.raises(FileNotFoundError):
-        sync_store.load('nonexistent')
+        populated_store.load('nonexistent')
 
     # Load with wrong version
     with pytest.raises(ValueError, match='Version mismatch'):
-        sync_store.load('test', LoadPromptOptions(version='wrongversion'))
+        populated_store.load('test', LoadPromptOptions(version='wrongversion'))
+
+
+def test_load_prompt_normalizes_line_endings(sync_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test that loading translates line endings like a text-mode read."""
+    (temp_dir / 'test.prompt').write_bytes(b'line 1\r\nline 2\rline 3\n')
+
+    result = sync_store.load('test')
+    assert result.source == 'line 1\nline 2\nline 3\n'
+    assert result.version == calculate_version('line 1\nline 2\nline 3\n')
 
 
 def test_load_partial(sync_store: DirStoreSync, temp_dir: Path) -> None:
@@ -248,6 +262,18 @@ def test_save_prompt(sync_store: DirStoreSync, temp_dir: Path) -> None:
     assert loaded.version == version
 
 
+def test_load_prompt_after_save(sync_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test that loading after a save returns the saved source."""
+    create_test_prompt_sync(temp_dir, 'test.prompt', 'test source 1')
+    assert sync_store.load('test').source == 'test source 1'
+
+    # Same size as the original, so only the save itself can invalidate.
+    sync_store.save(PromptData(name='test', source='test source 2'))
+    result = sync_store.load('test')
+    assert result.source == 'test source 2'
+    assert result.version == calculate_version('test source 2')
+
+
 def test_save_prompt_variant(sync_store: DirStoreSync, temp_dir: Path) -> None:
     """Test saving prompt variants synchronously."""
     source = 'new variant source'
@@ -351,3 +377,9 @@ def test_delete_prioritizes_prompt_over_partial(sync_store: DirStoreSync, temp_d
 
     assert not (temp_dir / 'conflict.prompt').exists()  # Prompt should be gone
     assert (temp_dir / '_conflict.prompt').exists()  # Partial should remain
+
+
+def test_calculate_version_accepts_bytes() -> None:
+    """Test that UTF-8 bytes hash to the same version as the string."""
+    source = 'test source \u00e9'
+    assert calculate_version(source.encode('utf-8')) == calculate_version(source)
@@ -138,6 +138,11 @@ class TestUnquote(unittest.TestCase):
         self.assertEqual(unquote('""test\'test""'), '"test\'test"')
         self.assertEqual(unquote("''test\"test''"), "'test\"test'")
 
+    def test_unquote_custom_pairs(self) -> None:
+        """Test that unquote removes only the given quote pairs."""
+        self.assertEqual(unquote('<test>', {('<', '>')}), 'test')
+        self.assertEqual(unquote('"test"', {('<', '>')}), '"test"')
+
 
 if __name__ == '__main__':
     unittest.main()
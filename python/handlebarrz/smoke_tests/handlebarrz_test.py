@@ -16,6 +16,7 @@
 
 """Test code for smoke tests."""
 
+import functools
 from typing import Any
 
 from handlebarrz import HelperOptions, Template
@@ -28,8 +29,18 @@ def loud_helper(params: list[str], options: HelperOptions) -> str:
     return text.upper()
 
 
-template = Template()
-template.register_helper('loud', loud_helper)
+@functools.cache
+def make_template(source: str) -> Template:
+    """Test template factory.
+
+    Templates are parsed when registered, so each source is set up once and
+    the same Template is reused by every render.
+    """
+    template = Template()
+    template.register_helper('loud', loud_helper)
+    template.register_template('test', source)
+    return template
+
+
 template_string = '{{loud name}}'
-template.register_template('test', template_string)
-print(template.render('test', {'name': 'world'}))
+print(make_template(template_string).render('test', {'name': 'world'}))